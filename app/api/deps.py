@@ -0,0 +1,9 @@
+from app.database.connection import SessionLocal
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,78 +1,117 @@
 import uuid
 import logging
-from sqlalchemy.orm import Session
-from app.api.v1.endpoints.beverage.schemas import BeverageCreateSchema
+from typing import List
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import Session, load_only
+from app.api.v1.endpoints.beverage.schemas import BeverageCreateSchema, BeverageListItemSchema
 from app.database.models import Beverage
+from app.database.statements import insert_on_conflict_do_nothing
 
-# Configure the logger
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Only the columns the list endpoint serializes
+LIST_ITEM_COLUMNS = [getattr(Beverage, field) for field in BeverageListItemSchema.__fields__]
+
+SELECT_BY_NAME = select(Beverage).where(Beverage.name == bindparam('name'))
+SELECT_ID_BY_NAME = select(Beverage.id).where(Beverage.name == bindparam('name'))
+
+BULK_INSERT_PAGE_SIZE = 1000
 
 
 def create_beverage(schema: BeverageCreateSchema, db: Session):
     try:
-        logging.info(f'Attempting to create a beverage with data: {schema.dict()}')
-        entity = Beverage(**schema.dict())
-        db.add(entity)
+        logger.info('Attempting to create a beverage: %s', schema.name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Beverage data: %s', schema.dict())
+        statement = insert_on_conflict_do_nothing(db, Beverage, schema.dict(), ['name']).returning(Beverage)
+        entity = db.scalars(statement).first()
         db.commit()
-        logging.info(f'Beverage created successfully with ID: {entity.id}')
+        if entity:
+            logger.info('Beverage created successfully with ID: %s', entity.id)
+        else:
+            logger.info('Beverage with name %s already exists, nothing created.', schema.name)
         return entity
     except Exception as e:
-        logging.error(f'Error occurred while creating beverage: {e}')
+        logger.error('Error occurred while creating beverage: %s', e)
         raise e
 
 
+def bulk_create_beverages(schemas: List[BeverageCreateSchema], db: Session):
+    logger.info('Attempting to create %s beverages', len(schemas))
+    entities = []
+    # One multi-row INSERT per page keeps the statement below the bind parameter limit of the database
+    for start in range(0, len(schemas), BULK_INSERT_PAGE_SIZE):
+        values = [schema.dict() for schema in schemas[start:start + BULK_INSERT_PAGE_SIZE]]
+        # Plain rows instead of entities, they are not expired by the commit and need no reload
+        table = Beverage.__table__
+        statement = insert_on_conflict_do_nothing(db, table, values, ['name']).returning(*table.columns)
+        entities.extend(db.execute(statement).all())
+    db.commit()
+    logger.info('%s beverages created, %s already existed.', len(entities), len(schemas) - len(entities))
+    return entities
+
+
 def get_beverage_by_id(beverage_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching beverage with ID: {beverage_id}')
-    entity = db.query(Beverage).filter(Beverage.id == beverage_id).first()
+    logger.info('Fetching beverage with ID: %s', beverage_id)
+    entity = db.get(Beverage, beverage_id)
     if entity:
-        logging.info(f'Beverage found: {entity.name} (ID: {beverage_id})')
+        logger.info('Beverage found: %s (ID: %s)', entity.name, beverage_id)
     else:
-        logging.warning(f'No beverage found with ID: {beverage_id}')
+        logger.warning('No beverage found with ID: %s', beverage_id)
     return entity
 
 
 def get_beverage_by_name(beverage_name: str, db: Session):
-    logging.info(f'Fetching beverage with name: {beverage_name}')
-    entity = db.query(Beverage).filter(Beverage.name == beverage_name).first()
+    logger.info('Fetching beverage with name: %s', beverage_name)
+    entity = db.execute(SELECT_BY_NAME, {'name': beverage_name}).scalar_one_or_none()
     if entity:
-        logging.info(f'Beverage found: {entity.name} (ID: {entity.id})')
+        logger.info('Beverage found: %s (ID: %s)', entity.name, entity.id)
     else:
-        logging.warning(f'No beverage found with name: {beverage_name}')
+        logger.warning('No beverage found with name: %s', beverage_name)
     return entity
 
 
+def get_beverage_id_by_name(beverage_name: str, db: Session):
+    logger.info('Fetching beverage ID with name: %s', beverage_name)
+    entity_id = db.execute(SELECT_ID_BY_NAME, {'name': beverage_name}).scalar_one_or_none()
+    if entity_id:
+        logger.info('Beverage found with ID: %s', entity_id)
+    else:
+        logger.warning('No beverage found with name: %s', beverage_name)
+    return entity_id
+
+
 def get_all_beverages(db: Session):
-    logging.info('Fetching all beverages from the database.')
-    beverages = db.query(Beverage).all()
-    logging.info(f'Total beverages fetched: {len(beverages)}')
+    logger.info('Fetching all beverages from the database.')
+    beverages = db.scalars(select(Beverage).options(load_only(*LIST_ITEM_COLUMNS))).all()
+    logger.info('Total beverages fetched: %s', len(beverages))
     return beverages
 
 
-def update_beverage(beverage: Beverage, changed_beverage: BeverageCreateSchema, db: Session):
-    try:
-        logging.info(f'Updating beverage with ID: {beverage.id}')
-        for key, value in changed_beverage.dict().items():
-            logging.debug(f"Updating field \'{key}\' to value \'{value}\'")
-            setattr(beverage, key, value)
-        db.commit()
-        db.refresh(beverage)
-        logging.info(f'Beverage updated successfully: {beverage.name} (ID: {beverage.id})')
-        return beverage
-    except Exception as e:
-        logging.error(f'Error occurred while updating beverage with ID {beverage.id}: {e}')
-        raise e
+def update_beverage_with_same_name(beverage_id: uuid.UUID, changed_beverage: BeverageCreateSchema, db: Session):
+    logger.info('Updating beverage with ID %s if its name is still: %s', beverage_id, changed_beverage.name)
+    statement = update(Beverage).where(Beverage.id == beverage_id, Beverage.name == changed_beverage.name) \
+        .values(**changed_beverage.dict()) \
+        .returning(Beverage.id)
+    updated_id = db.execute(statement).scalar()
+    db.commit()
+    if updated_id:
+        logger.info('Beverage updated successfully (ID: %s)', beverage_id)
+    else:
+        logger.info('No beverage with ID %s and name %s, nothing updated.', beverage_id, changed_beverage.name)
+    return updated_id is not None
 
 
 def delete_beverage_by_id(beverage_id: uuid.UUID, db: Session):
     try:
-        logging.info(f'Attempting to delete beverage with ID: {beverage_id}')
-        entity = get_beverage_by_id(beverage_id, db)
-        if entity:
-            db.delete(entity)
-            db.commit()
-            logging.info(f'Beverage with ID {beverage_id} deleted successfully.')
-        else:
-            logging.warning(f'No beverage found with ID: {beverage_id}, nothing to delete.')
+        logger.info('Attempting to delete beverage with ID: %s', beverage_id)
+        deleted_id = db.execute(delete(Beverage).where(Beverage.id == beverage_id).returning(Beverage.id)).scalar()
+        db.commit()
+        if deleted_id:
+            logger.info('Beverage with ID %s deleted successfully.', beverage_id)
+            return True
+        logger.warning('No beverage found with ID: %s, nothing to delete.', beverage_id)
+        return False
     except Exception as e:
-        logging.error(f'Error occurred while deleting beverage with ID {beverage_id}: {e}')
+        logger.error('Error occurred while deleting beverage with ID %s: %s', beverage_id, e)
         raise e
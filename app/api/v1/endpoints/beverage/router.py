@@ -8,20 +8,12 @@ from sqlalchemy.orm import Session
 
 import app.api.v1.endpoints.beverage.crud as beverage_crud
 from app.api.v1.endpoints.beverage.schemas import BeverageSchema, BeverageCreateSchema, BeverageListItemSchema
-from app.database.connection import SessionLocal
+from app.api.v1.responses import orm_list_response, orm_response, url_for
+from app.api.deps import get_db
 
 ITEM_NOT_FOUND = 'Item not found'
 
-# Configure the logger
-logging.basicConfig(level=logging.INFO)
-
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+logger = logging.getLogger(__name__)
 
 
 router = APIRouter()
@@ -29,29 +21,39 @@ router = APIRouter()
 
 @router.get('', response_model=List[BeverageListItemSchema], tags=['beverage'])
 def get_all_beverages(db: Session = Depends(get_db)):
-    logging.info('Fetching all beverages.')
+    logger.info('Fetching all beverages.')
     beverages = beverage_crud.get_all_beverages(db)
-    logging.info(f'Total beverages fetched: {len(beverages)}')
-    return beverages
+    logger.info('Total beverages fetched: %s', len(beverages))
+    return orm_list_response(BeverageListItemSchema, beverages)
 
 
 @router.post('', response_model=BeverageSchema, status_code=status.HTTP_201_CREATED, tags=['beverage'])
 def create_beverage(beverage: BeverageCreateSchema,
                     request: Request,
+                    response: Response,
                     db: Session = Depends(get_db)):
-    logging.info(f'Attempting to create a new beverage: {beverage.name}')
-    beverage_found = beverage_crud.get_beverage_by_name(beverage.name, db)
+    logger.info('Attempting to create a new beverage: %s', beverage.name)
+    new_beverage = beverage_crud.create_beverage(beverage, db)
 
-    if beverage_found:
-        logging.info(f'Beverage already exists with ID: {beverage_found.id}. Redirecting to existing beverage.')
-        url = request.url_for('get_beverage', beverage_id=beverage_found.id)
-        return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
+    if not new_beverage:
+        beverage_found = beverage_crud.get_beverage_by_name(beverage.name, db)
+        logger.info('Beverage already exists with ID: %s. Returning existing beverage.', beverage_found.id)
+        response.status_code = status.HTTP_200_OK
+        response.headers['Location'] = url_for(request, 'get_beverage', beverage_id=beverage_found.id)
+        return beverage_found
 
-    new_beverage = beverage_crud.create_beverage(beverage, db)
-    logging.info(f'Beverage created successfully with ID: {new_beverage.id}')
+    logger.info('Beverage created successfully with ID: %s', new_beverage.id)
     return new_beverage
 
 
+@router.post('/bulk', response_model=List[BeverageSchema], status_code=status.HTTP_201_CREATED, tags=['beverage'])
+def bulk_create_beverages(beverages: List[BeverageCreateSchema], db: Session = Depends(get_db)):
+    logger.info('Attempting to create %s beverages.', len(beverages))
+    new_beverages = beverage_crud.bulk_create_beverages(beverages, db)
+    logger.info('Total beverages created: %s', len(new_beverages))
+    return new_beverages
+
+
 @router.put('/{beverage_id}', response_model=BeverageSchema, tags=['beverage'])
 def update_beverage(
         beverage_id: uuid.UUID,
@@ -59,29 +61,25 @@ def update_beverage(
         request: Request,
         response: Response,
         db: Session = Depends(get_db)):
-    logging.info(f'Attempting to update beverage with ID: {beverage_id}')
-    beverage_found = beverage_crud.get_beverage_by_id(beverage_id, db)
+    logger.info('Attempting to update beverage with ID: %s', beverage_id)
+    if beverage_crud.update_beverage_with_same_name(beverage_id, changed_beverage, db):
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
 
-    if beverage_found:
-        if beverage_found.name == changed_beverage.name:
-            logging.info(f'No changes detected for beverage with ID: {beverage_id}')
-            beverage_crud.update_beverage(beverage_found, changed_beverage, db)
-            return Response(status_code=status.HTTP_204_NO_CONTENT)
-        else:
-            logging.info(f'Updating beverage name from {beverage_found.name} to {changed_beverage.name}')
-            beverage_name_found = beverage_crud.get_beverage_by_name(changed_beverage.name, db)
-            if beverage_name_found:
-                logging.info(f'Conflict with existing beverage ID: {beverage_name_found.id}. Redirecting.')
-                url = request.url_for('get_beverage', beverage_id=beverage_name_found.id)
-                return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
-            else:
-                updated_beverage = beverage_crud.create_beverage(changed_beverage, db)
-                logging.info(f'Beverage updated successfully with new ID: {updated_beverage.id}')
-                response.status_code = status.HTTP_201_CREATED
-    else:
-        logging.warning(f'No beverage found with ID: {beverage_id}')
+    beverage_found = beverage_crud.get_beverage_by_id(beverage_id, db)
+    if not beverage_found:
+        logger.warning('No beverage found with ID: %s', beverage_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
+    logger.info('Updating beverage name from %s to %s', beverage_found.name, changed_beverage.name)
+    updated_beverage = beverage_crud.create_beverage(changed_beverage, db)
+    if not updated_beverage:
+        beverage_id_found = beverage_crud.get_beverage_id_by_name(changed_beverage.name, db)
+        logger.info('Conflict with existing beverage ID: %s. Redirecting.', beverage_id_found)
+        url = url_for(request, 'get_beverage', beverage_id=beverage_id_found)
+        return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
+
+    logger.info('Beverage updated successfully with new ID: %s', updated_beverage.id)
+    response.status_code = status.HTTP_201_CREATED
     return updated_beverage
 
 
@@ -89,28 +87,25 @@ def update_beverage(
 def get_beverage(
         beverage_id: uuid.UUID,
         db: Session = Depends(get_db)):
-    logging.info(f'Fetching beverage with ID: {beverage_id}')
+    logger.info('Fetching beverage with ID: %s', beverage_id)
     beverage = beverage_crud.get_beverage_by_id(beverage_id, db)
 
     if not beverage:
-        logging.warning(f'Beverage with ID: {beverage_id} not found.')
+        logger.warning('Beverage with ID: %s not found.', beverage_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    logging.info(f'Beverage fetched successfully: {beverage.name} (ID: {beverage_id})')
-    return beverage
+    logger.info('Beverage fetched successfully: %s (ID: %s)', beverage.name, beverage_id)
+    return orm_response(BeverageSchema, beverage)
 
 
-@router.delete('/{beverage_id}', response_model=None, tags=['beverage'])
+@router.delete('/{beverage_id}', status_code=status.HTTP_204_NO_CONTENT, response_class=Response, tags=['beverage'])
 def delete_beverage(
         beverage_id: uuid.UUID,
         db: Session = Depends(get_db)):
-    logging.info(f'Attempting to delete beverage with ID: {beverage_id}')
-    beverage = beverage_crud.get_beverage_by_id(beverage_id, db)
-
-    if not beverage:
-        logging.warning(f'Beverage with ID: {beverage_id} not found. Cannot delete.')
+    logger.info('Attempting to delete beverage with ID: %s', beverage_id)
+    if not beverage_crud.delete_beverage_by_id(beverage_id, db):
+        logger.warning('Beverage with ID: %s not found. Cannot delete.', beverage_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    beverage_crud.delete_beverage_by_id(beverage_id, db)
-    logging.info(f'Beverage with ID: {beverage_id} deleted successfully.')
+    logger.info('Beverage with ID: %s deleted successfully.', beverage_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
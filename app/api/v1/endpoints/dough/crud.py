@@ -1,78 +1,117 @@
 import uuid
 import logging
-from sqlalchemy.orm import Session
-from app.api.v1.endpoints.dough.schemas import DoughCreateSchema
+from typing import List
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import Session, load_only
+from app.api.v1.endpoints.dough.schemas import DoughCreateSchema, DoughListItemSchema
 from app.database.models import Dough
+from app.database.statements import insert_on_conflict_do_nothing
 
-# Configure the logger
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Only the columns the list endpoint serializes
+LIST_ITEM_COLUMNS = [getattr(Dough, field) for field in DoughListItemSchema.__fields__]
+
+SELECT_BY_NAME = select(Dough).where(Dough.name == bindparam('name'))
+SELECT_ID_BY_NAME = select(Dough.id).where(Dough.name == bindparam('name'))
+
+BULK_INSERT_PAGE_SIZE = 1000
 
 
 def create_dough(schema: DoughCreateSchema, db: Session):
     try:
-        logging.info(f'Attempting to create a dough with data: {schema.dict()}')
-        entity = Dough(**schema.dict())
-        db.add(entity)
+        logger.info('Attempting to create a dough: %s', schema.name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Dough data: %s', schema.dict())
+        statement = insert_on_conflict_do_nothing(db, Dough, schema.dict(), ['name']).returning(Dough)
+        entity = db.scalars(statement).first()
         db.commit()
-        logging.info(f'Dough created successfully with ID: {entity.id}')
+        if entity:
+            logger.info('Dough created successfully with ID: %s', entity.id)
+        else:
+            logger.info('Dough with name %s already exists, nothing created.', schema.name)
         return entity
     except Exception as e:
-        logging.error(f'Error occurred while creating dough: {e}')
+        logger.error('Error occurred while creating dough: %s', e)
         raise e
 
 
+def bulk_create_doughs(schemas: List[DoughCreateSchema], db: Session):
+    logger.info('Attempting to create %s doughs', len(schemas))
+    entities = []
+    # One multi-row INSERT per page keeps the statement below the bind parameter limit of the database
+    for start in range(0, len(schemas), BULK_INSERT_PAGE_SIZE):
+        values = [schema.dict() for schema in schemas[start:start + BULK_INSERT_PAGE_SIZE]]
+        # Plain rows instead of entities, they are not expired by the commit and need no reload
+        table = Dough.__table__
+        statement = insert_on_conflict_do_nothing(db, table, values, ['name']).returning(*table.columns)
+        entities.extend(db.execute(statement).all())
+    db.commit()
+    logger.info('%s doughs created, %s already existed.', len(entities), len(schemas) - len(entities))
+    return entities
+
+
 def get_dough_by_id(dough_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching dough with ID: {dough_id}')
-    entity = db.query(Dough).filter(Dough.id == dough_id).first()
+    logger.info('Fetching dough with ID: %s', dough_id)
+    entity = db.get(Dough, dough_id)
     if entity:
-        logging.info(f'Dough found: {entity.name} (ID: {dough_id})')
+        logger.info('Dough found: %s (ID: %s)', entity.name, dough_id)
     else:
-        logging.warning(f'No dough found with ID: {dough_id}')
+        logger.warning('No dough found with ID: %s', dough_id)
     return entity
 
 
 def get_dough_by_name(dough_name: str, db: Session):
-    logging.info(f'Fetching dough with name: {dough_name}')
-    entity = db.query(Dough).filter(Dough.name == dough_name).first()
+    logger.info('Fetching dough with name: %s', dough_name)
+    entity = db.execute(SELECT_BY_NAME, {'name': dough_name}).scalar_one_or_none()
     if entity:
-        logging.info(f'Dough found: {entity.name} (ID: {entity.id})')
+        logger.info('Dough found: %s (ID: %s)', entity.name, entity.id)
     else:
-        logging.warning(f'No dough found with name: {dough_name}')
+        logger.warning('No dough found with name: %s', dough_name)
     return entity
 
 
+def get_dough_id_by_name(dough_name: str, db: Session):
+    logger.info('Fetching dough ID with name: %s', dough_name)
+    entity_id = db.execute(SELECT_ID_BY_NAME, {'name': dough_name}).scalar_one_or_none()
+    if entity_id:
+        logger.info('Dough found with ID: %s', entity_id)
+    else:
+        logger.warning('No dough found with name: %s', dough_name)
+    return entity_id
+
+
 def get_all_doughs(db: Session):
-    logging.info('Fetching all doughs from the database.')
-    doughs = db.query(Dough).all()
-    logging.info(f'Total doughs fetched: {len(doughs)}')
+    logger.info('Fetching all doughs from the database.')
+    doughs = db.scalars(select(Dough).options(load_only(*LIST_ITEM_COLUMNS))).all()
+    logger.info('Total doughs fetched: %s', len(doughs))
     return doughs
 
 
-def update_dough(dough: Dough, changed_dough: DoughCreateSchema, db: Session):
-    try:
-        logging.info(f'Updating dough with ID: {dough.id}')
-        for key, value in changed_dough.dict().items():
-            logging.debug(f"Updating field \'{key}\' to value \'{value}\'")
-            setattr(dough, key, value)
-        db.commit()
-        db.refresh(dough)
-        logging.info(f'Dough updated successfully: {dough.name} (ID: {dough.id})')
-        return dough
-    except Exception as e:
-        logging.error(f'Error occurred while updating dough with ID {dough.id}: {e}')
-        raise e
+def update_dough_with_same_name(dough_id: uuid.UUID, changed_dough: DoughCreateSchema, db: Session):
+    logger.info('Updating dough with ID %s if its name is still: %s', dough_id, changed_dough.name)
+    statement = update(Dough).where(Dough.id == dough_id, Dough.name == changed_dough.name) \
+        .values(**changed_dough.dict()) \
+        .returning(Dough.id)
+    updated_id = db.execute(statement).scalar()
+    db.commit()
+    if updated_id:
+        logger.info('Dough updated successfully (ID: %s)', dough_id)
+    else:
+        logger.info('No dough with ID %s and name %s, nothing updated.', dough_id, changed_dough.name)
+    return updated_id is not None
 
 
 def delete_dough_by_id(dough_id: uuid.UUID, db: Session):
     try:
-        logging.info(f'Attempting to delete dough with ID: {dough_id}')
-        entity = get_dough_by_id(dough_id, db)
-        if entity:
-            db.delete(entity)
-            db.commit()
-            logging.info(f'Dough with ID {dough_id} deleted successfully.')
-        else:
-            logging.warning(f'No dough found with ID: {dough_id}, nothing to delete.')
+        logger.info('Attempting to delete dough with ID: %s', dough_id)
+        deleted_id = db.execute(delete(Dough).where(Dough.id == dough_id).returning(Dough.id)).scalar()
+        db.commit()
+        if deleted_id:
+            logger.info('Dough with ID %s deleted successfully.', dough_id)
+            return True
+        logger.warning('No dough found with ID: %s, nothing to delete.', dough_id)
+        return False
     except Exception as e:
-        logging.error(f'Error occurred while deleting dough with ID {dough_id}: {e}')
+        logger.error('Error occurred while deleting dough with ID %s: %s', dough_id, e)
         raise e
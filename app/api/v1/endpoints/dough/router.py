@@ -8,50 +8,52 @@ from sqlalchemy.orm import Session
 
 import app.api.v1.endpoints.dough.crud as dough_crud
 from app.api.v1.endpoints.dough.schemas import DoughSchema, DoughCreateSchema, DoughListItemSchema
-from app.database.connection import SessionLocal
+from app.api.v1.responses import orm_list_response, orm_response, url_for
+from app.api.deps import get_db
 
 ITEM_NOT_FOUND = 'Item not found'
 
-# Configure the logger
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get('', response_model=List[DoughListItemSchema], tags=['dough'])
 def get_all_doughs(db: Session = Depends(get_db)):
-    logging.info('Fetching all doughs.')
+    logger.info('Fetching all doughs.')
     doughs = dough_crud.get_all_doughs(db)
-    logging.info(f'Total doughs fetched: {len(doughs)}')
-    return doughs
+    logger.info('Total doughs fetched: %s', len(doughs))
+    return orm_list_response(DoughListItemSchema, doughs)
 
 
 @router.post('', response_model=DoughSchema, status_code=status.HTTP_201_CREATED, tags=['dough'])
 def create_dough(dough: DoughCreateSchema,
                  request: Request,
+                 response: Response,
                  db: Session = Depends(get_db),
                  ):
-    logging.info(f'Attempting to create a new dough: {dough.name}')
-    dough_found = dough_crud.get_dough_by_name(dough.name, db)
+    logger.info('Attempting to create a new dough: %s', dough.name)
+    new_dough = dough_crud.create_dough(dough, db)
 
-    if dough_found:
-        logging.info(f'Dough already exists with ID: {dough_found.id}. Redirecting to existing dough.')
-        url = request.url_for('get_dough', dough_id=dough_found.id)
-        return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
+    if not new_dough:
+        dough_found = dough_crud.get_dough_by_name(dough.name, db)
+        logger.info('Dough already exists with ID: %s. Returning existing dough.', dough_found.id)
+        response.status_code = status.HTTP_200_OK
+        response.headers['Location'] = url_for(request, 'get_dough', dough_id=dough_found.id)
+        return dough_found
 
-    new_dough = dough_crud.create_dough(dough, db)
-    logging.info(f'Dough created successfully with ID: {new_dough.id}')
+    logger.info('Dough created successfully with ID: %s', new_dough.id)
     return new_dough
 
 
+@router.post('/bulk', response_model=List[DoughSchema], status_code=status.HTTP_201_CREATED, tags=['dough'])
+def bulk_create_doughs(doughs: List[DoughCreateSchema], db: Session = Depends(get_db)):
+    logger.info('Attempting to create %s doughs.', len(doughs))
+    new_doughs = dough_crud.bulk_create_doughs(doughs, db)
+    logger.info('Total doughs created: %s', len(new_doughs))
+    return new_doughs
+
+
 @router.put('/{dough_id}', response_model=DoughSchema, tags=['dough'])
 def update_dough(
         dough_id: uuid.UUID,
@@ -60,30 +62,25 @@ def update_dough(
         response: Response,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Attempting to update dough with ID: {dough_id}')
+    logger.info('Attempting to update dough with ID: %s', dough_id)
+    if dough_crud.update_dough_with_same_name(dough_id, changed_dough, db):
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
     dough_found = dough_crud.get_dough_by_id(dough_id, db)
-    updated_dough = None
-
-    if dough_found:
-        if dough_found.name == changed_dough.name:
-            logging.info(f'No changes detected for dough with ID: {dough_id}')
-            dough_crud.update_dough(dough_found, changed_dough, db)
-            return Response(status_code=status.HTTP_204_NO_CONTENT)
-        else:
-            logging.info(f'Updating dough name from {dough_found.name} to {changed_dough.name}')
-            dough_name_found = dough_crud.get_dough_by_name(changed_dough.name, db)
-            if dough_name_found:
-                logging.info(f'Conflict with existing dough ID: {dough_name_found.id}. Redirecting.')
-                url = request.url_for('get_dough', dough_id=dough_name_found.id)
-                return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
-            else:
-                updated_dough = dough_crud.create_dough(changed_dough, db)
-                logging.info(f'Dough updated successfully with new ID: {updated_dough.id}')
-                response.status_code = status.HTTP_201_CREATED
-    else:
-        logging.warning(f'No dough found with ID: {dough_id}')
+    if not dough_found:
+        logger.warning('No dough found with ID: %s', dough_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
+    logger.info('Updating dough name from %s to %s', dough_found.name, changed_dough.name)
+    updated_dough = dough_crud.create_dough(changed_dough, db)
+    if not updated_dough:
+        dough_id_found = dough_crud.get_dough_id_by_name(changed_dough.name, db)
+        logger.info('Conflict with existing dough ID: %s. Redirecting.', dough_id_found)
+        url = url_for(request, 'get_dough', dough_id=dough_id_found)
+        return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
+
+    logger.info('Dough updated successfully with new ID: %s', updated_dough.id)
+    response.status_code = status.HTTP_201_CREATED
     return updated_dough
 
 
@@ -91,26 +88,23 @@ def update_dough(
 def get_dough(dough_id: uuid.UUID,
               db: Session = Depends(get_db),
               ):
-    logging.info(f'Fetching dough with ID: {dough_id}')
+    logger.info('Fetching dough with ID: %s', dough_id)
     dough = dough_crud.get_dough_by_id(dough_id, db)
 
     if not dough:
-        logging.warning(f'Dough with ID: {dough_id} not found.')
+        logger.warning('Dough with ID: %s not found.', dough_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    logging.info(f'Dough fetched successfully: {dough.name} (ID: {dough_id})')
-    return dough
+    logger.info('Dough fetched successfully: %s (ID: %s)', dough.name, dough_id)
+    return orm_response(DoughSchema, dough)
 
 
-@router.delete('/{dough_id}', response_model=None, tags=['dough'])
+@router.delete('/{dough_id}', status_code=status.HTTP_204_NO_CONTENT, response_class=Response, tags=['dough'])
 def delete_dough(dough_id: uuid.UUID, db: Session = Depends(get_db)):
-    logging.info(f'Attempting to delete dough with ID: {dough_id}')
-    dough = dough_crud.get_dough_by_id(dough_id, db)
-
-    if not dough:
-        logging.warning(f'Dough with ID: {dough_id} not found. Cannot delete.')
+    logger.info('Attempting to delete dough with ID: %s', dough_id)
+    if not dough_crud.delete_dough_by_id(dough_id, db):
+        logger.warning('Dough with ID: %s not found. Cannot delete.', dough_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    dough_crud.delete_dough_by_id(dough_id, db)
-    logging.info(f'Dough with ID: {dough_id} deleted successfully.')
+    logger.info('Dough with ID: %s deleted successfully.', dough_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
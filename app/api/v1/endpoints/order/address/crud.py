@@ -15,7 +15,7 @@ def create_address(schema: AddressCreateSchema, db: Session):
 
 
 def get_address_by_id(address_id: uuid.UUID, db: Session):
-    entity = db.query(Address).filter(Address.id == address_id).first()
+    entity = db.get(Address, address_id)
     return entity
 
 
@@ -1,219 +1,297 @@
 import uuid
 import logging
 from typing import List, Optional
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 from app.api.v1.endpoints.order.address.crud import create_address
+from app.api.v1.endpoints.order.stock_logic.stock_beverage_crud import consume_beverages
+from app.api.v1.endpoints.order.stock_logic.stock_ingredients_crud import consume_ingredients_of_pizza_types
 from app.api.v1.endpoints.order.schemas import (
-    JoinedPizzaPizzaTypeSchema, OrderBeverageQuantityCreateSchema, OrderCreateSchema,
+    OrderBeverageQuantityCreateSchema, OrderCreateSchema,
 )
-from app.database.models import Order, Pizza, PizzaType, OrderBeverageQuantity, Beverage, OrderStatus
+from app.database.models import (
+    Address, Order, Pizza, PizzaType, PizzaTypeToppingQuantity, OrderBeverageQuantity, Beverage, OrderStatus,
+)
+
+logger = logging.getLogger(__name__)
 
-# Configure logger
-logging.basicConfig(level=logging.INFO)
+# Relationships an order list can be expanded with, loaded for all orders with one IN query each
+ORDER_EXPANDABLE_RELATIONS = {
+    'address': selectinload(Order.address),
+}
+
+# Everything the stock logic touches when it walks the ingredients of a pizza
+PIZZA_INGREDIENTS = joinedload(Pizza.pizza_type).options(
+    joinedload(PizzaType.dough),
+    selectinload(PizzaType.toppings).joinedload(PizzaTypeToppingQuantity.topping),
+)
 
 
 def create_order(schema: OrderCreateSchema, db: Session):
-    logging.info(f'Creating order for user_id: {schema.user_id}')
+    logger.info('Creating order for user_id: %s', schema.user_id)
     address = create_address(schema.address, db)
     order = Order(user_id=schema.user_id)
     order.address = address
     order.order_status = OrderStatus.TRANSMITTED
     db.add(order)
     db.commit()
-    logging.info(f'Order created successfully with ID: {order.id}')
+    logger.info('Order created successfully with ID: %s', order.id)
+    return order
+
+
+def create_order_copy(schema: OrderCreateSchema, copy_order: Order, db: Session):
+    logger.info('Creating order for user_id: %s as copy of order ID: %s', schema.user_id, copy_order.id)
+    # Order, stock and items are written in one transaction, a shortfall rolls all of it back
+    order = Order(user_id=schema.user_id, order_status=OrderStatus.TRANSMITTED)
+    order.address = Address(**schema.address.dict())
+    db.add(order)
+    db.flush()
+
+    beverage_quantities = {beverage.beverage_id: beverage.quantity for beverage in copy_order.beverages}
+    if not consume_ingredients_of_pizza_types([pizza.pizza_type for pizza in copy_order.pizzas], db) \
+            or not consume_beverages(beverage_quantities, db):
+        db.rollback()
+        logger.warning('Insufficient stock to copy order ID: %s', copy_order.id)
+        return None
+
+    if copy_order.pizzas:
+        db.execute(insert(Pizza), [{'order_id': order.id, 'pizza_type_id': pizza.pizza_type_id}
+                                   for pizza in copy_order.pizzas])
+    if beverage_quantities:
+        db.execute(insert(OrderBeverageQuantity), [{'order_id': order.id, 'beverage_id': beverage_id,
+                                                    'quantity': quantity}
+                                                   for beverage_id, quantity in beverage_quantities.items()])
+    db.commit()
+    logger.info('Order created successfully with ID: %s', order.id)
     return order
 
 
 def get_order_by_id(order_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching order with ID: {order_id}')
-    entity = db.query(Order).filter(Order.id == order_id).first()
+    logger.info('Fetching order with ID: %s', order_id)
+    entity = db.get(Order, order_id)
+    if entity:
+        logger.info('Order found: %s', entity.id)
+    else:
+        logger.warning('Order with ID %s not found', order_id)
+    return entity
+
+
+def get_order_with_items_by_id(order_id: uuid.UUID, db: Session):
+    logger.info('Fetching order with items with ID: %s', order_id)
+    # Any relationship not preloaded here raises on access, add new ones to the options
+    entity = db.get(Order, order_id, options=[
+        selectinload(Order.pizzas).options(PIZZA_INGREDIENTS),
+        selectinload(Order.beverages),
+        joinedload(Order.address),
+        raiseload('*'),
+    ])
     if entity:
-        logging.info(f'Order found: {entity.id}')
+        logger.info('Order found: %s', entity.id)
     else:
-        logging.warning(f'Order with ID {order_id} not found')
+        logger.warning('Order with ID %s not found', order_id)
     return entity
 
 
-def get_all_orders(db: Session):
-    logging.info('Fetching all orders.')
-    entities = db.query(Order).all()
-    logging.info(f'Total orders fetched: {len(entities)}')
+def get_all_orders(
+        db: Session,
+        limit: Optional[int] = None,
+        after: Optional[uuid.UUID] = None,
+        expand: Optional[List[str]] = None,
+):
+    logger.info('Fetching all orders after ID: %s, limit: %s', after, limit)
+    query = db.query(Order).options(*[ORDER_EXPANDABLE_RELATIONS[relation] for relation in expand or []])
+    if after:
+        query = query.filter(Order.id > after)
+    entities = query.order_by(Order.id).limit(limit).all()
+    logger.info('Total orders fetched: %s', len(entities))
     return entities
 
 
 def delete_order_by_id(order_id: uuid.UUID, db: Session):
-    logging.info(f'Deleting order with ID: {order_id}')
+    logger.info('Deleting order with ID: %s', order_id)
     entity = get_order_by_id(order_id, db)
     if entity:
         db.delete(entity)
         db.commit()
-        logging.info(f'Order with ID {order_id} deleted successfully.')
+        logger.info('Order with ID %s deleted successfully.', order_id)
     else:
-        logging.warning(f'Order with ID {order_id} not found, nothing to delete.')
+        logger.warning('Order with ID %s not found, nothing to delete.', order_id)
 
 
 def update_order_status(order: Order, changed_order: OrderStatus, db: Session):
-    logging.info(f'Updating order status for ID: {order.id} to {changed_order}')
+    logger.info('Updating order status for ID: %s to %s', order.id, changed_order)
     setattr(order, 'order_status', changed_order)
     db.commit()
     db.refresh(order)
-    logging.info(f'Order status updated successfully: {order.order_status}')
+    logger.info('Order status updated successfully: %s', order.order_status)
     return order
 
 
 def create_pizza(pizza_type: PizzaType, db: Session):
-    logging.info(f'Creating a pizza of type: {pizza_type.name if pizza_type else "None"}')
+    logger.info('Creating a pizza of type: %s', pizza_type.name if pizza_type else 'None')
     entity = Pizza()
     if pizza_type:
         entity.pizza_type_id = pizza_type.id
     db.add(entity)
     db.commit()
-    logging.info(f'Pizza created successfully with ID: {entity.id}')
+    logger.info('Pizza created successfully with ID: %s', entity.id)
     return entity
 
 
 def add_pizza_to_order(order: Order, pizza_type: PizzaType, db: Session):
-    logging.info(f'Adding pizza to order ID: {order.id}')
+    logger.info('Adding pizza to order ID: %s', order.id)
     pizza = create_pizza(pizza_type, db)
     order.pizzas.append(pizza)
     db.commit()
-    db.refresh(order)
-    logging.info(f'Pizza added to order ID: {order.id} successfully.')
+    logger.info('Pizza added to order ID: %s successfully.', order.id)
     return pizza
 
 
 def get_pizza_by_id(pizza_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching pizza with ID: {pizza_id}')
-    entity = db.query(Pizza).filter(Pizza.id == pizza_id).first()
+    logger.info('Fetching pizza with ID: %s', pizza_id)
+    entity = db.get(Pizza, pizza_id)
     if entity:
-        logging.info(f'Pizza found: {entity.id}')
+        logger.info('Pizza found: %s', entity.id)
     else:
-        logging.warning(f'Pizza with ID {pizza_id} not found')
+        logger.warning('Pizza with ID %s not found', pizza_id)
+    return entity
+
+
+def get_pizza_with_ingredients_by_id(pizza_id: uuid.UUID, db: Session):
+    logger.info('Fetching pizza with ingredients with ID: %s', pizza_id)
+    entity = db.get(Pizza, pizza_id, options=[PIZZA_INGREDIENTS, raiseload('*')])
+    if entity:
+        logger.info('Pizza found: %s', entity.id)
+    else:
+        logger.warning('Pizza with ID %s not found', pizza_id)
     return entity
 
 
 def get_all_pizzas_of_order(order: Order, db: Session):
-    logging.info(f'Fetching all pizzas for order ID: {order.id}')
-    pizza_types = db.query(Pizza.id, PizzaType.name, PizzaType.price, PizzaType.description, PizzaType.dough_id) \
+    logger.info('Fetching all pizzas for order ID: %s', order.id)
+    pizzas = db.query(Pizza.id, PizzaType.name, PizzaType.price, PizzaType.description, PizzaType.default_sauce_id) \
         .join(Pizza.pizza_type) \
-        .filter(Pizza.order_id == order.id)
-
-    returnlist: List[JoinedPizzaPizzaTypeSchema] = []
-    for pizza_type in pizza_types.all():
-        returnlist.append(pizza_type)
+        .filter(Pizza.order_id == order.id) \
+        .all()
 
-    logging.info(f'Total pizzas fetched for order ID {order.id}: {len(returnlist)}')
-    return returnlist
+    logger.info('Total pizzas fetched for order ID %s: %s', order.id, len(pizzas))
+    return pizzas
 
 
 def delete_pizza_from_order(order: Order, pizza_id: uuid.UUID, db: Session):
-    logging.info(f'Removing pizza with ID {pizza_id} from order ID: {order.id}')
-    entity = db.query(Pizza).filter(Pizza.order_id == order.id, Pizza.id == pizza_id).first()
-    if entity:
+    logger.info('Removing pizza with ID %s from order ID: %s', pizza_id, order.id)
+    entity = db.get(Pizza, pizza_id)
+    if entity and entity.order_id == order.id:
         db.delete(entity)
         db.commit()
-        logging.info(f'Pizza with ID {pizza_id} removed successfully from order ID: {order.id}')
+        logger.info('Pizza with ID %s removed successfully from order ID: %s', pizza_id, order.id)
         return True
     else:
-        logging.warning(f'Pizza with ID {pizza_id} not found in order ID: {order.id}')
+        logger.warning('Pizza with ID %s not found in order ID: %s', pizza_id, order.id)
         return False
 
 
 def create_beverage_quantity(order: Order, schema: OrderBeverageQuantityCreateSchema, db: Session):
-    logging.info(f'Adding beverage to order ID: {order.id} with data: {schema.dict()}')
+    logger.info('Adding beverage to order ID: %s', order.id)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Beverage quantity data: %s', schema.dict())
     entity = OrderBeverageQuantity(**schema.dict())
     order.beverages.append(entity)
     db.commit()
-    db.refresh(order)
-    logging.info(f'Beverage added to order ID: {order.id} successfully.')
+    db.refresh(entity, attribute_names=['quantity'])
+    logger.info('Beverage added to order ID: %s successfully.', order.id)
     return entity
 
 
 def get_beverage_quantity_by_id(order_id: uuid.UUID, beverage_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching beverage with ID {beverage_id} in order ID {order_id}')
-    entity = db.query(OrderBeverageQuantity).filter(
-        OrderBeverageQuantity.beverage_id == beverage_id,
-        OrderBeverageQuantity.order_id == order_id,
-    ).first()
+    logger.info('Fetching beverage with ID %s in order ID %s', beverage_id, order_id)
+    entity = db.get(OrderBeverageQuantity, (order_id, beverage_id))
     if entity:
-        logging.info(f'Beverage quantity found: {entity.quantity}')
+        logger.info('Beverage quantity found: %s', entity.quantity)
     else:
-        logging.warning(f'Beverage with ID {beverage_id} not found in order ID {order_id}')
+        logger.warning('Beverage with ID %s not found in order ID %s', beverage_id, order_id)
     return entity
 
 
 def get_joined_beverage_quantities_by_order(order_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching all beverages for order ID: {order_id}')
-    entities = db.query(OrderBeverageQuantity).filter(OrderBeverageQuantity.order_id == order_id)
+    logger.info('Fetching all beverages for order ID: %s', order_id)
+    # The beverages come with the same SELECT instead of one lazy load per quantity
+    entities = db.query(OrderBeverageQuantity).options(joinedload(OrderBeverageQuantity.beverage)) \
+        .filter(OrderBeverageQuantity.order_id == order_id)
     beverages = entities.all()
-    logging.info(f'Total beverages fetched for order ID {order_id}: {len(beverages)}')
+    logger.info('Total beverages fetched for order ID %s: %s', order_id, len(beverages))
     return beverages
 
 
-def update_beverage_quantity_of_order(order_id: uuid.UUID, beverage_id: uuid.UUID, new_quantity: int, db: Session):
-    logging.info(f'Updating beverage quantity for beverage ID {beverage_id} in order ID {order_id} to {new_quantity}')
-    order_beverage = db.query(OrderBeverageQuantity).filter(
-        order_id == OrderBeverageQuantity.order_id,
-        beverage_id == OrderBeverageQuantity.beverage_id,
-    ).first()
-    if order_beverage:
-        setattr(order_beverage, 'quantity', new_quantity)
-        db.commit()
-        db.refresh(order_beverage)
-        logging.info(f'Beverage quantity updated successfully for beverage ID {beverage_id}')
-    else:
-        logging.warning(f'Beverage with ID {beverage_id} not found in order ID {order_id}')
+def change_beverage_quantity_of_order(order_beverage: OrderBeverageQuantity, new_quantity: int, db: Session):
+    logger.info('Changing beverage quantity for beverage ID %s in order ID %s to %s',
+                order_beverage.beverage_id, order_beverage.order_id, new_quantity)
+    # Stock and quantity change in one transaction, a shortfall leaves both untouched
+    if not consume_beverages({order_beverage.beverage_id: new_quantity - order_beverage.quantity}, db):
+        db.rollback()
+        logger.warning('Insufficient stock for beverage ID %s', order_beverage.beverage_id)
+        return None
+
+    order_beverage.quantity = new_quantity
+    db.commit()
+    logger.info('Beverage quantity changed successfully for beverage ID %s', order_beverage.beverage_id)
     return order_beverage
 
 
 def delete_beverage_from_order(order_id: uuid.UUID, beverage_id: uuid.UUID, db: Session):
-    logging.info(f'Removing beverage with ID {beverage_id} from order ID {order_id}')
-    entity = db.query(OrderBeverageQuantity).filter(
-        order_id == OrderBeverageQuantity.order_id,
-        beverage_id == OrderBeverageQuantity.beverage_id,
-    ).first()
+    logger.info('Removing beverage with ID %s from order ID %s', beverage_id, order_id)
+    entity = db.get(OrderBeverageQuantity, (order_id, beverage_id))
     if entity:
         db.delete(entity)
         db.commit()
-        logging.info(f'Beverage with ID {beverage_id} removed successfully from order ID {order_id}')
+        logger.info('Beverage with ID %s removed successfully from order ID %s', beverage_id, order_id)
         return True
     else:
-        logging.warning(f'Beverage with ID {beverage_id} not found in order ID {order_id}')
+        logger.warning('Beverage with ID %s not found in order ID %s', beverage_id, order_id)
         return False
 
 
 def get_price_of_order(order_id: uuid.UUID, db: Session):
-    logging.info(f'Calculating total price for order ID: {order_id}')
-    price_beverage: float = 0
-    for row in db.query(Beverage.price, OrderBeverageQuantity.quantity) \
-            .join(OrderBeverageQuantity) \
-            .join(Order) \
-            .filter(Order.id == order_id):
-        price_beverage += (row.price * row.quantity)
-
-    price_pizza = db.query(func.sum(PizzaType.price)) \
+    logger.info('Calculating total price for order ID: %s', order_id)
+    price_beverages = select(func.coalesce(func.sum(Beverage.price * OrderBeverageQuantity.quantity), 0)) \
+        .select_from(Beverage) \
+        .join(OrderBeverageQuantity) \
+        .where(OrderBeverageQuantity.order_id == order_id) \
+        .scalar_subquery()
+
+    price_pizzas = select(func.coalesce(func.sum(PizzaType.price), 0)) \
+        .select_from(PizzaType) \
         .join(Pizza) \
-        .join(Order) \
-        .filter(Order.id == order_id).first()[0]
+        .where(Pizza.order_id == order_id) \
+        .scalar_subquery()
 
-    total_price = price_beverage
-    if price_pizza:
-        total_price += price_pizza
+    # Selecting from the order itself makes the same round trip tell apart unknown orders (None) and empty ones (0)
+    total_price = db.execute(select(price_beverages + price_pizzas).where(Order.id == order_id)).scalar_one_or_none()
+    if total_price is None:
+        logger.warning('Order with ID %s not found.', order_id)
+        return None
 
-    logging.info(f'Total price for order ID {order_id}: {total_price}')
+    logger.info('Total price for order ID %s: %s', order_id, total_price)
     return total_price
 
 
-def get_orders_by_statuses(statuses: Optional[List[OrderStatus]], db: Session):
+def get_orders_by_statuses(
+        statuses: Optional[List[OrderStatus]],
+        db: Session,
+        limit: Optional[int] = None,
+        after: Optional[uuid.UUID] = None,
+        expand: Optional[List[str]] = None,
+):
     """
     Fetch all orders that match one or more of the given statuses.
     If no statuses are provided, returns all orders.
     """
-    logging.info(f'Fetching orders by statuses: {statuses}')
-    query = db.query(Order)
+    logger.info('Fetching orders by statuses: %s after ID: %s, limit: %s', statuses, after, limit)
+    query = db.query(Order).options(*[ORDER_EXPANDABLE_RELATIONS[relation] for relation in expand or []])
     if statuses and len(statuses) > 0:
         query = query.filter(Order.order_status.in_(statuses))
-    entities = query.all()
-    logging.info(f'Total orders fetched by statuses {statuses or "None"}: {len(entities)}')
+    if after:
+        query = query.filter(Order.id > after)
+    entities = query.order_by(Order.id).limit(limit).all()
+    logger.info('Total orders fetched by statuses %s: %s', statuses or 'None', len(entities))
     return entities
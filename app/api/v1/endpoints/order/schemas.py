@@ -34,6 +34,13 @@ class OrderSchema(OrderCreateSchema):
     address: AddressSchema
 
 
+class OrderListSchema(OrderBaseSchema):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    order_status: OrderStatus
+    order_datetime: datetime.datetime
+
+
 class OrderPriceSchema(OrderBaseSchema):
     price: float
 
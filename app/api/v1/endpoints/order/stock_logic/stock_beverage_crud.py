@@ -1,5 +1,7 @@
 import uuid
+from typing import Dict
 
+from sqlalchemy import case, update
 from sqlalchemy.orm import Session
 
 import app.api.v1.endpoints.beverage.crud as beverage_crud
@@ -18,14 +20,44 @@ def beverage_is_available(beverage_id: uuid.UUID, amount: int, db: Session):
 
 
 def change_stock_of_beverage(beverage_id: uuid.UUID, change_amount: int, db: Session):
-    # Get Beverage
-    beverage = db.query(Beverage).filter(Beverage.id == beverage_id).first()
-
-    # Check if Beverage exists and if Stock is not getting smaller than zero
-    if beverage and beverage.stock + change_amount >= 0:
-        setattr(beverage, 'stock', beverage.stock + change_amount)
-        db.commit()
-        db.refresh(beverage)
+    # The guard keeps the stock from getting smaller than zero in the same statement that changes it
+    changed = db.execute(
+        update(Beverage)
+        .where(Beverage.id == beverage_id, Beverage.stock + change_amount >= 0)
+        .values(stock=Beverage.stock + change_amount),
+    ).rowcount
+    db.commit()
+    return changed == 1
+
+
+def consume_beverages(quantities: Dict[uuid.UUID, int], db: Session):
+    # Guarded like the ingredients, the caller owns the transaction and rolls back when this returns False
+    if not quantities:
         return True
 
-    return False
+    required = case(quantities, value=Beverage.id)
+    consumed = db.execute(
+        update(Beverage)
+        .where(Beverage.id.in_(quantities), Beverage.stock >= required)
+        .values(stock=Beverage.stock - required),
+    ).rowcount
+    return consumed == len(quantities)
+
+
+def restore_beverages(quantities: Dict[uuid.UUID, int], db: Session):
+    # The caller commits together with the removal of the beverages
+    if quantities:
+        db.execute(
+            update(Beverage)
+            .where(Beverage.id.in_(quantities))
+            .values(stock=Beverage.stock + case(quantities, value=Beverage.id)),
+        )
+
+
+def try_consume_beverage(beverage_id: uuid.UUID, amount: int, db: Session):
+    if not consume_beverages({beverage_id: amount}, db):
+        db.rollback()
+        return False
+
+    db.commit()
+    return True
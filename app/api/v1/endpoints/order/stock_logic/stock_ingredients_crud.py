@@ -1,34 +1,91 @@
+from collections import Counter
+from typing import List
+
+from sqlalchemy import case, update
 from sqlalchemy.orm import Session
 import logging
 
-from app.database.models import PizzaType
+from app.database.models import Dough, PizzaType, Topping
 
+logger = logging.getLogger(__name__)
 
-def ingredients_are_available(pizza_type: PizzaType):
-    if pizza_type.dough.stock == 0:
-        logging.warning(f' stock for dough is zero {pizza_type.dough.name}')
-        return False
 
-    for topping_quantity in pizza_type.toppings:
-        if topping_quantity.topping.stock < topping_quantity.quantity:
-            logging.warning(f' not enough topping with name  {topping_quantity.topping.name}')
-            return False
+def count_ingredients_of_pizza_types(pizza_types: List[PizzaType]):
+    doughs = Counter(pizza_type.dough_id for pizza_type in pizza_types)
+    quantities = Counter()
+    for pizza_type in pizza_types:
+        for topping_quantity in pizza_type.toppings:
+            quantities[topping_quantity.topping_id] += topping_quantity.quantity
+    return doughs, quantities
 
-    return True
 
+def consume_ingredients_of_pizza_types(pizza_types: List[PizzaType], db: Session):
+    # The stock guards in the WHERE clauses make check and decrement one atomic step,
+    # the caller owns the transaction and has to roll back when this returns False
+    doughs, quantities = count_ingredients_of_pizza_types(pizza_types)
 
-def reduce_stock_of_ingredients(pizza_type: PizzaType, db: Session):
-    pizza_type.dough.stock -= 1
-    for topping_quantity in pizza_type.toppings:
-        topping_quantity.topping.stock -= topping_quantity.quantity
+    doughs_consumed = 0
+    if doughs:
+        required = case(doughs, value=Dough.id)
+        doughs_consumed = db.execute(
+            update(Dough)
+            .where(Dough.id.in_(doughs), Dough.stock >= required)
+            .values(stock=Dough.stock - required),
+        ).rowcount
+    toppings_consumed = 0
+    if quantities:
+        required = case(quantities, value=Topping.id)
+        toppings_consumed = db.execute(
+            update(Topping)
+            .where(Topping.id.in_(quantities), Topping.stock >= required)
+            .values(stock=Topping.stock - required),
+        ).rowcount
 
-    db.commit()
+    return doughs_consumed == len(doughs) and toppings_consumed == len(quantities)
 
 
-def increase_stock_of_ingredients(pizza_type: PizzaType, db: Session):
-    pizza_type.dough.stock += 1
+def restore_ingredients_of_pizza_types(pizza_types: List[PizzaType], db: Session):
+    # One UPDATE per table for all pizzas, the caller commits together with the removal of the pizzas
+    doughs, quantities = count_ingredients_of_pizza_types(pizza_types)
+    if doughs:
+        db.execute(
+            update(Dough)
+            .where(Dough.id.in_(doughs))
+            .values(stock=Dough.stock + case(doughs, value=Dough.id)),
+        )
+    if quantities:
+        db.execute(
+            update(Topping)
+            .where(Topping.id.in_(quantities))
+            .values(stock=Topping.stock + case(quantities, value=Topping.id)),
+        )
+
 
-    for topping_quantity in pizza_type.toppings:
-        topping_quantity.topping.stock += topping_quantity.quantity
+def try_consume_ingredients(pizza_type: PizzaType, db: Session):
+    # A shortfall is rolled back here. The decrement itself is committed by the caller together with the pizza,
+    # so a pizza that cannot be inserted does not use up any stock.
+    if not consume_ingredients_of_pizza_types([pizza_type], db):
+        db.rollback()
+        logger.warning(' not enough ingredients for pizza type %s', pizza_type.name)
+        return False
+
+    return True
+
+
+def change_stock_of_ingredients(pizza_type: PizzaType, amount: int, db: Session):
+    # One UPDATE for the dough and one for all toppings, scaled by the quantity the pizza type needs
+    db.execute(update(Dough).where(Dough.id == pizza_type.dough_id).values(stock=Dough.stock + amount))
+
+    quantities = {topping_quantity.topping_id: topping_quantity.quantity for topping_quantity in pizza_type.toppings}
+    if quantities:
+        db.execute(
+            update(Topping)
+            .where(Topping.id.in_(quantities))
+            .values(stock=Topping.stock + amount * case(quantities, value=Topping.id)),
+        )
 
     db.commit()
+
+
+def increase_stock_of_ingredients(pizza_type: PizzaType, db: Session):
+    change_stock_of_ingredients(pizza_type, 1, db)
@@ -2,148 +2,171 @@ import uuid
 import logging
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
 from app.api.v1.endpoints.pizza_type.schemas import (
     PizzaTypeCreateSchema,
     PizzaTypeToppingQuantityCreateSchema,
 )
-from app.database.models import PizzaType, PizzaTypeToppingQuantity, Sauce
+from app.database.models import PizzaType, PizzaTypeToppingQuantity, Sauce, Topping
+from app.database.statements import insert_on_conflict_do_nothing
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 
 def create_pizza_type(schema: PizzaTypeCreateSchema, db: Session):
-    logging.info(f'Creating a new pizza type with data: {schema.dict()}')
+    logger.info('Creating a new pizza type with data: %s', schema)
 
     # Assign a default sauce if none is provided
     if not schema.default_sauce_id:
-        logging.info('No default sauce ID provided. Assigning the first available sauce.')
+        logger.info('No default sauce ID provided. Assigning the first available sauce.')
         default_sauce = db.query(Sauce).first()
         if not default_sauce:
-            logging.warning('No sauces available in the database.')
+            logger.warning('No sauces available in the database.')
             raise HTTPException(status_code=400, detail='No sauces available to assign as default')
         schema.default_sauce_id = default_sauce.id
 
     # Validate sauce (now assigned if it was missing)
-    sauce = db.query(Sauce).filter(Sauce.id == schema.default_sauce_id).first()
+    sauce = db.get(Sauce, schema.default_sauce_id)
     if not sauce:
-        logging.warning(f'Sauce with ID {schema.default_sauce_id} not found.')
+        logger.warning('Sauce with ID %s not found.', schema.default_sauce_id)
         raise HTTPException(status_code=404, detail='Sauce not found')
 
     try:
-        # Create entity from schema
-        entity = PizzaType(**schema.dict())
-        db.add(entity)
-        logging.info(f'Entity added to the session: {schema.dict()}')
+        # The unique name decides in the INSERT itself, nothing is inserted for an existing name
+        # Core INSERTs do not fill in the polymorphic discriminator the ORM would set on a new instance
+        values = {**schema.dict(), 'type': PizzaType.__mapper__.polymorphic_identity}
+        statement = insert_on_conflict_do_nothing(db, PizzaType, values, ['name']).returning(PizzaType)
+        entity = db.scalars(statement).first()
 
         # Commit transaction
         db.commit()
-        logging.info(f'Transaction committed successfully: {schema.dict()}')
-
-        # Refresh the entity
-        db.refresh(entity)
-        logging.info(f'Entity refreshed: {entity}')
-
-        # Log success
-        logging.info(f'Pizza type created successfully with ID: {entity.id}')
+        if entity:
+            logger.info('Pizza type created successfully with ID: %s', entity.id)
+        else:
+            logger.info('Pizza type with name %s already exists, nothing created.', schema.name)
     except Exception as e:
         # Rollback on error
         db.rollback()
         # Log error with schema information, ensuring safety
-        logging.error(f'Failed to create pizza type. Error: {e}, Data: {schema.dict()}')
+        logger.error('Failed to create pizza type. Error: %s, Data: %s', e, schema)
         raise
 
     return entity
 
 
 def get_pizza_type_by_id(pizza_type_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching pizza type with ID: {pizza_type_id}')
-    entity = db.query(PizzaType).filter(PizzaType.id == pizza_type_id).first()
+    logger.info('Fetching pizza type with ID: %s', pizza_type_id)
+    entity = db.get(PizzaType, pizza_type_id)
+    if entity:
+        logger.info('Pizza type found: %s (ID: %s)', entity.name, pizza_type_id)
+    else:
+        logger.warning('Pizza type with ID %s not found.', pizza_type_id)
+    return entity
+
+
+def get_pizza_type_by_id_with_relations(pizza_type_id: uuid.UUID, db: Session):
+    logger.info('Fetching pizza type with ID %s including toppings and dough', pizza_type_id)
+    entity = db.get(
+        PizzaType,
+        pizza_type_id,
+        options=[selectinload(PizzaType.toppings), joinedload(PizzaType.dough)],
+    )
     if entity:
-        logging.info(f'Pizza type found: {entity.name} (ID: {pizza_type_id})')
+        logger.info('Pizza type found: %s (ID: %s)', entity.name, pizza_type_id)
     else:
-        logging.warning(f'Pizza type with ID {pizza_type_id} not found.')
+        logger.warning('Pizza type with ID %s not found.', pizza_type_id)
     return entity
 
 
 def get_pizza_type_by_name(pizza_type_name: str, db: Session):
-    logging.info(f'Fetching pizza type with name: {pizza_type_name}')
-    entity = db.query(PizzaType).filter(PizzaType.name == pizza_type_name).first()
+    logger.info('Fetching pizza type with name: %s', pizza_type_name)
+    entity = db.execute(select(PizzaType).where(PizzaType.name == pizza_type_name)).scalar_one_or_none()
     if entity:
-        logging.info(f'Pizza type found: {entity.name} (ID: {entity.id})')
+        logger.info('Pizza type found: %s (ID: %s)', entity.name, entity.id)
     else:
-        logging.warning(f'Pizza type with name {pizza_type_name} not found.')
+        logger.warning('Pizza type with name %s not found.', pizza_type_name)
     return entity
 
 
 def get_all_pizza_types(db: Session):
-    logging.info('Fetching all pizza types.')
+    logger.info('Fetching all pizza types.')
     entities = db.query(PizzaType).all()
-    logging.info(f'Total pizza types fetched: {len(entities)}')
+    logger.info('Total pizza types fetched: %s', len(entities))
     return entities
 
 
-def update_pizza_type(pizza_type: PizzaType, changed_pizza_type: PizzaTypeCreateSchema, db: Session):
-    logging.info(f'Updating pizza type with ID: {pizza_type.id}')
-    for key, value in changed_pizza_type.dict().items():
-        logging.debug(f'Updating field "{key}" to value "{value}"')
-        setattr(pizza_type, key, value)
-
+def update_pizza_type_with_same_name(
+        pizza_type_id: uuid.UUID,
+        changed_pizza_type: PizzaTypeCreateSchema,
+        db: Session,
+):
+    logger.info('Updating pizza type with ID %s if its name is still: %s', pizza_type_id, changed_pizza_type.name)
+    statement = update(PizzaType) \
+        .where(PizzaType.id == pizza_type_id, PizzaType.name == changed_pizza_type.name) \
+        .values(**changed_pizza_type.dict()) \
+        .returning(PizzaType.id)
+    updated_id = db.execute(statement).scalar()
     db.commit()
-    db.refresh(pizza_type)
-    logging.info(f'Pizza type with ID {pizza_type.id} updated successfully.')
-    return pizza_type
+    if updated_id:
+        logger.info('Pizza type updated successfully (ID: %s)', pizza_type_id)
+    else:
+        logger.info('No pizza type with ID %s and name %s, nothing updated.', pizza_type_id, changed_pizza_type.name)
+    return updated_id is not None
 
 
 def delete_pizza_type_by_id(pizza_type_id: uuid.UUID, db: Session):
-    logging.info(f'Deleting pizza type with ID: {pizza_type_id}')
-    entity = get_pizza_type_by_id(pizza_type_id, db)
-    if entity:
-        db.delete(entity)
-        db.commit()
-        logging.info(f'Pizza type with ID {pizza_type_id} deleted successfully.')
-    else:
-        logging.warning(f'Pizza type with ID {pizza_type_id} not found, nothing to delete.')
+    logger.info('Deleting pizza type with ID: %s', pizza_type_id)
+    # Bulk deletes skip the ORM cascade, so the topping quantities go first in the same transaction
+    db.execute(delete(PizzaTypeToppingQuantity).where(PizzaTypeToppingQuantity.pizza_type_id == pizza_type_id))
+    deleted_id = db.execute(delete(PizzaType).where(PizzaType.id == pizza_type_id).returning(PizzaType.id)).scalar()
+    db.commit()
+    if deleted_id:
+        logger.info('Pizza type with ID %s deleted successfully.', pizza_type_id)
+        return True
+    logger.warning('Pizza type with ID %s not found, nothing to delete.', pizza_type_id)
+    return False
 
 
 def create_topping_quantity(
-        pizza_type: PizzaType,
+        pizza_type_id: uuid.UUID,
         schema: PizzaTypeToppingQuantityCreateSchema,
         db: Session,
 ):
-    logging.info(f'Adding topping quantity to pizza type ID: {pizza_type.id} with data: {schema.dict()}')
-    entity = PizzaTypeToppingQuantity(**schema.dict())
-    pizza_type.toppings.append(entity)
+    logger.info('Adding topping quantity to pizza type ID: %s with data: %s', pizza_type_id, schema)
+    entity = PizzaTypeToppingQuantity(pizza_type_id=pizza_type_id, **schema.dict())
+    db.add(entity)
     db.commit()
-    db.refresh(pizza_type)
-    logging.info(f'Topping quantity added successfully to pizza type ID: {pizza_type.id}')
+    logger.info('Topping quantity added successfully to pizza type ID: %s', pizza_type_id)
     return entity
 
 
-def get_topping_quantity_by_id(
+def get_topping_quantity_references(
         pizza_type_id: uuid.UUID,
         topping_id: uuid.UUID,
         db: Session,
 ):
-    logging.info(f'Fetching topping quantity for topping ID: {topping_id} in pizza type ID: {pizza_type_id}')
-    entity = db.query(PizzaTypeToppingQuantity) \
-        .filter(PizzaTypeToppingQuantity.topping_id == topping_id,
-                PizzaTypeToppingQuantity.pizza_type_id == pizza_type_id) \
-        .first()
-    if entity:
-        logging.info(f'Topping quantity found for topping ID {topping_id} in pizza type ID {pizza_type_id}')
-    else:
-        logging.warning(f'Topping quantity not found for topping ID {topping_id} in pizza type ID {pizza_type_id}')
-    return entity
+    logger.info('Checking pizza type ID %s and topping ID %s for a new topping quantity', pizza_type_id, topping_id)
+    # The three existence checks of a new topping quantity answered in one round trip
+    return db.execute(select(
+        exists().where(PizzaType.id == pizza_type_id).label('pizza_type'),
+        exists().where(Topping.id == topping_id).label('topping'),
+        exists().where(
+            PizzaTypeToppingQuantity.pizza_type_id == pizza_type_id,
+            PizzaTypeToppingQuantity.topping_id == topping_id,
+        ).label('topping_quantity'),
+    )).one()
 
 
-def get_joined_topping_quantities_by_pizza_type(
+def get_topping_quantity_by_id(
         pizza_type_id: uuid.UUID,
+        topping_id: uuid.UUID,
         db: Session,
 ):
-    logging.info(f'Fetching all topping quantities for pizza type ID: {pizza_type_id}')
-    entities = db.query(PizzaTypeToppingQuantity) \
-        .filter(PizzaTypeToppingQuantity.pizza_type_id == pizza_type_id).all()
-    logging.info(f'Total topping quantities fetched for pizza type ID {pizza_type_id}: {len(entities)}')
-    return entities
+    logger.info('Fetching topping quantity for topping ID: %s in pizza type ID: %s', topping_id, pizza_type_id)
+    entity = db.get(PizzaTypeToppingQuantity, (pizza_type_id, topping_id))
+    if entity:
+        logger.info('Topping quantity found for topping ID %s in pizza type ID %s', topping_id, pizza_type_id)
+    else:
+        logger.warning('Topping quantity not found for topping ID %s in pizza type ID %s', topping_id, pizza_type_id)
+    return entity
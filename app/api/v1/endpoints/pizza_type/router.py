@@ -8,7 +8,6 @@ from sqlalchemy.orm import Session
 
 import app.api.v1.endpoints.dough.crud as dough_crud
 import app.api.v1.endpoints.pizza_type.crud as pizza_type_crud
-import app.api.v1.endpoints.topping.crud as topping_crud
 from app.api.v1.endpoints.dough.schemas import DoughSchema
 from app.api.v1.endpoints.pizza_type.schemas import (
     JoinedPizzaTypeQuantitySchema,
@@ -16,30 +15,22 @@ from app.api.v1.endpoints.pizza_type.schemas import (
     PizzaTypeCreateSchema,
     PizzaTypeToppingQuantityCreateSchema,
 )
-from app.database.connection import SessionLocal
+from app.api.v1.responses import orm_list_response, orm_response, url_for
+from app.api.deps import get_db
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 ITEM_NOT_FOUND = 'Item not found'
 
 router = APIRouter()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get('', response_model=List[PizzaTypeSchema], tags=['pizza_type'])
 def get_all_pizza_types(db: Session = Depends(get_db)):
-    logging.info('Fetching all pizza types.')
+    logger.info('Fetching all pizza types.')
     pizza_types = pizza_type_crud.get_all_pizza_types(db)
-    logging.info(f'Total pizza types fetched: {len(pizza_types)}')
-    return pizza_types
+    logger.info('Total pizza types fetched: %s', len(pizza_types))
+    return orm_list_response(PizzaTypeSchema, pizza_types)
 
 
 @router.post('', response_model=PizzaTypeSchema, tags=['pizza_type'])
@@ -47,21 +38,20 @@ def create_pizza_type(
         pizza_type: PizzaTypeCreateSchema, request: Request,
         response: Response, db: Session = Depends(get_db),
 ):
-    logging.info(f'Creating pizza type with name: {pizza_type.name}')
-    pizza_type_found = pizza_type_crud.get_pizza_type_by_name(pizza_type.name, db)
-
-    if pizza_type_found:
-        logging.info(f'Pizza type already exists: {pizza_type_found.name} (ID: {pizza_type_found.id})')
-        url = request.url_for('get_pizza_type', pizza_type_id=pizza_type_found.id)
-        return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
-
+    logger.info('Creating pizza type with name: %s', pizza_type.name)
     dough = dough_crud.get_dough_by_id(pizza_type.dough_id, db)
     if not dough:
-        logging.warning(f'Dough with ID {pizza_type.dough_id} not found.')
+        logger.warning('Dough with ID %s not found.', pizza_type.dough_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
     new_pizza_type = pizza_type_crud.create_pizza_type(pizza_type, db)
-    logging.info(f'Pizza type created successfully: {new_pizza_type.name} (ID: {new_pizza_type.id})')
+    if not new_pizza_type:
+        pizza_type_found = pizza_type_crud.get_pizza_type_by_name(pizza_type.name, db)
+        logger.info('Pizza type already exists: %s (ID: %s)', pizza_type_found.name, pizza_type_found.id)
+        url = url_for(request, 'get_pizza_type', pizza_type_id=pizza_type_found.id)
+        return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
+
+    logger.info('Pizza type created successfully: %s (ID: %s)', new_pizza_type.name, new_pizza_type.id)
 
     response.status_code = status.HTTP_201_CREATED
     return new_pizza_type
@@ -75,30 +65,25 @@ def update_pizza_type(
         response: Response,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Updating pizza type with ID: {pizza_type_id}')
+    logger.info('Updating pizza type with ID: %s', pizza_type_id)
+    if pizza_type_crud.update_pizza_type_with_same_name(pizza_type_id, changed_pizza_type, db):
+        logger.info('Pizza type with ID %s updated in place.', pizza_type_id)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
     pizza_type_found = pizza_type_crud.get_pizza_type_by_id(pizza_type_id, db)
-    updated_pizza_type = None
-
-    if pizza_type_found:
-        if pizza_type_found.name == changed_pizza_type.name:
-            logging.info(f'No changes detected for pizza type: {pizza_type_found.name}')
-            pizza_type_crud.update_pizza_type(pizza_type_found, changed_pizza_type, db)
-            return Response(status_code=status.HTTP_204_NO_CONTENT)
-        else:
-            pizza_type_name_found = pizza_type_crud.get_pizza_type_by_name(changed_pizza_type.name, db)
-            if pizza_type_name_found:
-                logging.info(f'Pizza type name conflict: {changed_pizza_type.name} already exists.')
-                url = request.url_for('get_pizza_type', pizza_type_id=pizza_type_name_found.id)
-                return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
-            else:
-                updated_pizza_type = pizza_type_crud.create_pizza_type(changed_pizza_type, db)
-                logging.info(f'Pizza type updated successfully:'
-                             f' {updated_pizza_type.name} (ID: {updated_pizza_type.id})')
-                response.status_code = status.HTTP_201_CREATED
-    else:
-        logging.warning(f'Pizza type with ID {pizza_type_id} not found.')
+    if not pizza_type_found:
+        logger.warning('Pizza type with ID %s not found.', pizza_type_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
+    updated_pizza_type = pizza_type_crud.create_pizza_type(changed_pizza_type, db)
+    if not updated_pizza_type:
+        pizza_type_name_found = pizza_type_crud.get_pizza_type_by_name(changed_pizza_type.name, db)
+        logger.info('Pizza type name conflict: %s already exists.', changed_pizza_type.name)
+        url = url_for(request, 'get_pizza_type', pizza_type_id=pizza_type_name_found.id)
+        return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
+
+    logger.info('Pizza type updated successfully: %s (ID: %s)', updated_pizza_type.name, updated_pizza_type.id)
+    response.status_code = status.HTTP_201_CREATED
     return updated_pizza_type
 
 
@@ -107,30 +92,27 @@ def get_pizza_type(
         pizza_type_id: uuid.UUID,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Fetching pizza type with ID: {pizza_type_id}')
+    logger.info('Fetching pizza type with ID: %s', pizza_type_id)
     pizza_type = pizza_type_crud.get_pizza_type_by_id(pizza_type_id, db)
 
     if not pizza_type:
-        logging.warning(f'Pizza type with ID {pizza_type_id} not found.')
+        logger.warning('Pizza type with ID %s not found.', pizza_type_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    logging.info(f'Pizza type fetched successfully: {pizza_type.name} (ID: {pizza_type_id})')
-    return pizza_type
+    logger.info('Pizza type fetched successfully: %s (ID: %s)', pizza_type.name, pizza_type_id)
+    return orm_response(PizzaTypeSchema, pizza_type)
 
 
-@router.delete('/{pizza_type_id}', response_model=None, tags=['pizza_type'])
+@router.delete('/{pizza_type_id}', status_code=status.HTTP_204_NO_CONTENT, response_class=Response, tags=['pizza_type'])
 def delete_pizza_type(pizza_type_id: uuid.UUID,
                       db: Session = Depends(get_db),
                       ):
-    logging.info(f'Deleting pizza type with ID: {pizza_type_id}')
-    pizza_type = pizza_type_crud.get_pizza_type_by_id(pizza_type_id, db)
-
-    if not pizza_type:
-        logging.warning(f'Pizza type with ID {pizza_type_id} not found.')
+    logger.info('Deleting pizza type with ID: %s', pizza_type_id)
+    if not pizza_type_crud.delete_pizza_type_by_id(pizza_type_id, db):
+        logger.warning('Pizza type with ID %s not found.', pizza_type_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    pizza_type_crud.delete_pizza_type_by_id(pizza_type_id, db)
-    logging.info(f'Pizza type with ID {pizza_type_id} deleted successfully.')
+    logger.info('Pizza type with ID %s deleted successfully.', pizza_type_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -156,19 +138,19 @@ def get_pizza_type_toppings(
         db: Session = Depends(get_db),
         join: bool = False,
 ):
-    logging.info(f'Fetching toppings for pizza type ID: {pizza_type_id}')
-    pizza_type = pizza_type_crud.get_pizza_type_by_id(pizza_type_id, db)
+    logger.info('Fetching toppings for pizza type ID: %s', pizza_type_id)
+    pizza_type = pizza_type_crud.get_pizza_type_by_id_with_relations(pizza_type_id, db)
 
     if not pizza_type:
-        logging.warning(f'Pizza type with ID {pizza_type_id} not found.')
+        logger.warning('Pizza type with ID %s not found.', pizza_type_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    toppings = pizza_type.toppings
     if join:
-        toppings = pizza_type_crud.get_joined_topping_quantities_by_pizza_type(pizza_type.id, db)
+        logger.info('Toppings fetched successfully for pizza type ID: %s', pizza_type_id)
+        return pizza_type.toppings
 
-    logging.info(f'Toppings fetched successfully for pizza type ID: {pizza_type_id}')
-    return toppings
+    logger.info('Toppings fetched successfully for pizza type ID: %s', pizza_type_id)
+    return orm_list_response(PizzaTypeToppingQuantityCreateSchema, pizza_type.toppings)
 
 
 @router.post(
@@ -184,24 +166,23 @@ def create_pizza_type_topping(
         response: Response,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Adding topping to pizza type ID: {pizza_type_id}')
-    pizza_type = pizza_type_crud.get_pizza_type_by_id(pizza_type_id, db)
-    if not pizza_type:
-        logging.warning(f'Pizza type with ID {pizza_type_id} not found.')
+    logger.info('Adding topping to pizza type ID: %s', pizza_type_id)
+    references = pizza_type_crud.get_topping_quantity_references(pizza_type_id, topping_quantity.topping_id, db)
+    if not references.pizza_type:
+        logger.warning('Pizza type with ID %s not found.', pizza_type_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    if not topping_crud.get_topping_by_id(topping_quantity.topping_id, db):
-        logging.warning(f'Topping with ID {topping_quantity.topping_id} not found.')
+    if not references.topping:
+        logger.warning('Topping with ID %s not found.', topping_quantity.topping_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    topping_quantity_found = pizza_type_crud.get_topping_quantity_by_id(pizza_type_id, topping_quantity.topping_id, db)
-    if topping_quantity_found:
-        logging.info(f'Topping already exists for pizza type ID: {pizza_type_id}')
-        url = request.url_for('get_pizza_type_toppings', pizza_type_id=topping_quantity_found.pizza_type_id)
+    if references.topping_quantity:
+        logger.info('Topping already exists for pizza type ID: %s', pizza_type_id)
+        url = url_for(request, 'get_pizza_type_toppings', pizza_type_id=pizza_type_id)
         return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
 
-    new_topping_quantity = pizza_type_crud.create_topping_quantity(pizza_type, topping_quantity, db)
-    logging.info(f'Topping added successfully to pizza type ID: {pizza_type_id}')
+    new_topping_quantity = pizza_type_crud.create_topping_quantity(pizza_type_id, topping_quantity, db)
+    logger.info('Topping added successfully to pizza type ID: %s', pizza_type_id)
     return new_topping_quantity
 
 
@@ -215,13 +196,12 @@ def get_pizza_type_dough(
         response: Response,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Fetching dough for pizza type ID: {pizza_type_id}')
-    pizza_type = pizza_type_crud.get_pizza_type_by_id(pizza_type_id, db)
+    logger.info('Fetching dough for pizza type ID: %s', pizza_type_id)
+    pizza_type = pizza_type_crud.get_pizza_type_by_id_with_relations(pizza_type_id, db)
 
     if not pizza_type:
-        logging.warning(f'Pizza type with ID {pizza_type_id} not found.')
+        logger.warning('Pizza type with ID %s not found.', pizza_type_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    dough = pizza_type.dough
-    logging.info(f'Dough fetched successfully for pizza type ID: {pizza_type_id}')
-    return dough
+    logger.info('Dough fetched successfully for pizza type ID: %s', pizza_type_id)
+    return orm_response(DoughSchema, pizza_type.dough)
@@ -4,74 +4,74 @@ from sqlalchemy.orm import Session
 from app.api.v1.endpoints.sauce.schemas import SauceCreateSchema
 from app.database.models import Sauce
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 
 def create_sauce(schema: SauceCreateSchema, db: Session):
     try:
-        logging.info(f'Attempting to create a sauce with data: {schema.dict()}')
+        logger.info('Attempting to create a sauce with data: %s', schema)
         entity = Sauce(**schema.dict())
         db.add(entity)
         db.commit()
-        logging.info(f'Sauce created successfully with ID: {entity.id}')
+        logger.info('Sauce created successfully with ID: %s', entity.id)
         return entity
     except Exception as e:
-        logging.error(f'Error occurred while creating sauce: {e}')
+        logger.error('Error occurred while creating sauce: %s', e)
         raise e
 
 
 def get_sauce_by_id(sauce_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching sauce with ID: {sauce_id}')
-    entity = db.query(Sauce).filter(Sauce.id == sauce_id).first()
+    logger.info('Fetching sauce with ID: %s', sauce_id)
+    entity = db.get(Sauce, sauce_id)
     if entity:
-        logging.info(f'Sauce found: {entity.name} (ID: {sauce_id})')
+        logger.info('Sauce found: %s (ID: %s)', entity.name, sauce_id)
     else:
-        logging.warning(f'No sauce found with ID: {sauce_id}')
+        logger.warning('No sauce found with ID: %s', sauce_id)
     return entity
 
 
 def get_sauce_by_name(sauce_name: str, db: Session):
-    logging.info(f'Fetching sauce with name: {sauce_name}')
+    logger.info('Fetching sauce with name: %s', sauce_name)
     entity = db.query(Sauce).filter(Sauce.name == sauce_name).first()
     if entity:
-        logging.info(f'Sauce found: {entity.name} (ID: {entity.id})')
+        logger.info('Sauce found: %s (ID: %s)', entity.name, entity.id)
     else:
-        logging.warning(f'No sauce found with name: {sauce_name}')
+        logger.warning('No sauce found with name: %s', sauce_name)
     return entity
 
 
 def get_all_sauces(db: Session):
-    logging.info('Fetching all sauces from the database.')
+    logger.info('Fetching all sauces from the database.')
     sauces = db.query(Sauce).all()
-    logging.info(f'Total sauces fetched: {len(sauces)}')
+    logger.info('Total sauces fetched: %s', len(sauces))
     return sauces
 
 
 def update_sauce(sauce: Sauce, changed_sauce: SauceCreateSchema, db: Session):
     try:
-        logging.info(f'Updating sauce with ID: {sauce.id}')
+        logger.info('Updating sauce with ID: %s', sauce.id)
         for key, value in changed_sauce.dict().items():
-            logging.debug(f'Updating field \"{key}\" to value \"{value}\"')
+            logger.debug('Updating field \"%s\" to value \"%s\"', key, value)
             setattr(sauce, key, value)
         db.commit()
         db.refresh(sauce)
-        logging.info(f'Sauce updated successfully: {sauce.name} (ID: {sauce.id})')
+        logger.info('Sauce updated successfully: %s (ID: %s)', sauce.name, sauce.id)
         return sauce
     except Exception as e:
-        logging.error(f'Error occurred while updating sauce with ID {sauce.id}: {e}')
+        logger.error('Error occurred while updating sauce with ID %s: %s', sauce.id, e)
         raise e
 
 
 def delete_sauce_by_id(sauce_id: uuid.UUID, db: Session):
     try:
-        logging.info(f'Attempting to delete sauce with ID: {sauce_id}')
+        logger.info('Attempting to delete sauce with ID: %s', sauce_id)
         entity = get_sauce_by_id(sauce_id, db)
         if entity:
             db.delete(entity)
             db.commit()
-            logging.info(f'Sauce with ID {sauce_id} deleted successfully.')
+            logger.info('Sauce with ID %s deleted successfully.', sauce_id)
         else:
-            logging.warning(f'No sauce found with ID: {sauce_id}, nothing to delete.')
+            logger.warning('No sauce found with ID: %s, nothing to delete.', sauce_id)
     except Exception as e:
-        logging.error(f'Error occurred while deleting sauce with ID {sauce_id}: {e}')
+        logger.error('Error occurred while deleting sauce with ID %s: %s', sauce_id, e)
         raise e
@@ -7,51 +7,44 @@ from sqlalchemy.orm import Session
 
 import app.api.v1.endpoints.sauce.crud as sauce_crud
 from app.api.v1.endpoints.sauce.schemas import SauceSchema, SauceCreateSchema, SauceListItemSchema
-from app.database.connection import SessionLocal
+from app.api.v1.responses import orm_list_response, orm_response, url_for
+from app.api.deps import get_db
 
 ITEM_NOT_FOUND = 'Item not found'
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get('', response_model=List[SauceListItemSchema], tags=['sauce'])
 def get_all_sauces(db: Session = Depends(get_db)):
-    logging.info('Fetching all sauces.')
+    logger.info('Fetching all sauces.')
     sauces = sauce_crud.get_all_sauces(db)
-    logging.info(f'Total sauces fetched: {len(sauces)}')
-    return sauces
+    logger.info('Total sauces fetched: %s', len(sauces))
+    return orm_list_response(SauceListItemSchema, sauces)
 
 
 @router.post('', response_model=SauceSchema, status_code=status.HTTP_201_CREATED, tags=['sauce'])
 def create_sauce(sauce: SauceCreateSchema, request: Request, db: Session = Depends(get_db)):
-    logging.info(f'Attempting to create a new sauce: {sauce.name}')
+    logger.info('Attempting to create a new sauce: %s', sauce.name)
     sauce_found = sauce_crud.get_sauce_by_name(sauce.name, db)
 
     if sauce_found:
-        logging.info(f'Sauce already exists with ID: {sauce_found.id}. Redirecting to existing sauce.')
-        url = request.url_for('get_sauce', sauce_id=sauce_found.id)
+        logger.info('Sauce already exists with ID: %s. Redirecting to existing sauce.', sauce_found.id)
+        url = url_for(request, 'get_sauce', sauce_id=sauce_found.id)
         return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
 
     new_sauce = sauce_crud.create_sauce(sauce, db)
-    logging.info(f'Sauce created successfully with ID: {new_sauce.id}')
+    logger.info('Sauce created successfully with ID: %s', new_sauce.id)
     return new_sauce
 
 
 @router.put('/{sauce_id}', response_model=SauceSchema, tags=['sauce'])
 def update_sauce(sauce_id: uuid.UUID, changed_sauce: SauceCreateSchema, db: Session = Depends(get_db)):
-    logging.info(f'Attempting to update sauce with ID: {sauce_id}')
+    logger.info('Attempting to update sauce with ID: %s', sauce_id)
     sauce_found = sauce_crud.get_sauce_by_id(sauce_id, db)
     if not sauce_found:
-        logging.warning(f'No sauce found with ID: {sauce_id}')
+        logger.warning('No sauce found with ID: %s', sauce_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
     return sauce_crud.update_sauce(sauce_found, changed_sauce, db)
@@ -59,20 +52,20 @@ def update_sauce(sauce_id: uuid.UUID, changed_sauce: SauceCreateSchema, db: Sess
 
 @router.get('/{sauce_id}', response_model=SauceSchema, tags=['sauce'])
 def get_sauce(sauce_id: uuid.UUID, db: Session = Depends(get_db)):
-    logging.info(f'Fetching sauce with ID: {sauce_id}')
+    logger.info('Fetching sauce with ID: %s', sauce_id)
     sauce = sauce_crud.get_sauce_by_id(sauce_id, db)
     if not sauce:
-        logging.warning(f'Sauce with ID: {sauce_id} not found.')
+        logger.warning('Sauce with ID: %s not found.', sauce_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
-    return sauce
+    return orm_response(SauceSchema, sauce)
 
 
-@router.delete('/{sauce_id}', response_model=None, tags=['sauce'])
+@router.delete('/{sauce_id}', status_code=status.HTTP_204_NO_CONTENT, response_class=Response, tags=['sauce'])
 def delete_sauce(sauce_id: uuid.UUID, db: Session = Depends(get_db)):
-    logging.info(f'Attempting to delete sauce with ID: {sauce_id}')
+    logger.info('Attempting to delete sauce with ID: %s', sauce_id)
     sauce = sauce_crud.get_sauce_by_id(sauce_id, db)
     if not sauce:
-        logging.warning(f'Sauce with ID: {sauce_id} not found.')
+        logger.warning('Sauce with ID: %s not found.', sauce_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
     sauce_crud.delete_sauce_by_id(sauce_id, db)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,82 +1,81 @@
 import uuid
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session, load_only
 from app.api.v1.endpoints.topping.schemas import ToppingCreateSchema, ToppingListItemSchema
 from app.database.models import Topping
+from app.database.statements import insert_on_conflict_do_nothing
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Only the columns the list endpoint serializes
+LIST_ITEM_COLUMNS = [getattr(Topping, field) for field in ToppingListItemSchema.__fields__]
 
 
 def create_topping(schema: ToppingCreateSchema, db: Session):
-    logging.info(f'Creating a new topping with data: {schema.dict()}')
-    entity = Topping(**schema.dict())
-    db.add(entity)
+    logger.info('Creating a new topping with data: %s', schema)
+    # The unique name decides in the INSERT itself, nothing is inserted for an existing name
+    # The schema is flat, a shallow dict of its fields is enough for the INSERT
+    statement = insert_on_conflict_do_nothing(db, Topping, dict(schema), ['name']).returning(Topping)
+    entity = db.scalars(statement).first()
     db.commit()
-    logging.info(f'Topping created successfully with ID: {entity.id}')
+    if entity:
+        logger.info('Topping created successfully with ID: %s', entity.id)
+    else:
+        logger.info('Topping with name %s already exists, nothing created.', schema.name)
     return entity
 
 
 def get_topping_by_id(topping_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching topping with ID: {topping_id}')
-    entity = db.query(Topping).filter(Topping.id == topping_id).first()
+    logger.info('Fetching topping with ID: %s', topping_id)
+    entity = db.get(Topping, topping_id)
     if entity:
-        logging.info(f'Topping found: {entity.name} (ID: {topping_id})')
+        logger.info('Topping found: %s (ID: %s)', entity.name, topping_id)
     else:
-        logging.warning(f'Topping with ID {topping_id} not found.')
+        logger.warning('Topping with ID %s not found.', topping_id)
     return entity
 
 
 def get_topping_by_name(topping_name: str, db: Session):
-    logging.info(f'Fetching topping with name: {topping_name}')
-    entity = db.query(Topping).filter(Topping.name == topping_name).first()
+    logger.info('Fetching topping with name: %s', topping_name)
+    entity = db.execute(select(Topping).where(Topping.name == topping_name)).scalar_one_or_none()
     if entity:
-        logging.info(f'Topping found: {entity.name} (ID: {entity.id})')
+        logger.info('Topping found: %s (ID: %s)', entity.name, entity.id)
     else:
-        logging.warning(f'Topping with name {topping_name} not found.')
+        logger.warning('Topping with name %s not found.', topping_name)
     return entity
 
 
 def get_all_toppings(db: Session):
-    logging.info('Fetching all toppings.')
-    entities = db.query(Topping).all()
+    logger.info('Fetching all toppings.')
+    entities = db.scalars(select(Topping).options(load_only(*LIST_ITEM_COLUMNS))).all()
     if entities:
-        logging.info(f'Total toppings fetched: {len(entities)}')
-        return_entities = [
-            ToppingListItemSchema(
-                **{
-                    'id': entity.id,
-                    'name': entity.name,
-                    'price': entity.price,
-                    'description': entity.description,
-                },
-            )
-            for entity in entities
-        ]
-        return return_entities
+        logger.info('Total toppings fetched: %s', len(entities))
     else:
-        logging.warning('No toppings found in the database.')
+        logger.warning('No toppings found in the database.')
     return entities
 
 
-def update_topping(topping: Topping, changed_topping: ToppingCreateSchema, db: Session):
-    logging.info(f'Updating topping with ID: {topping.id}')
-    for key, value in changed_topping.dict().items():
-        logging.debug(f'Updating field {key} to value {value}')
-        setattr(topping, key, value)
-
+def update_topping_with_same_name(topping_id: uuid.UUID, changed_topping: ToppingCreateSchema, db: Session):
+    logger.info('Updating topping with ID %s if its name is still: %s', topping_id, changed_topping.name)
+    statement = update(Topping).where(Topping.id == topping_id, Topping.name == changed_topping.name) \
+        .values(**dict(changed_topping)) \
+        .returning(Topping.id)
+    updated_id = db.execute(statement).scalar()
     db.commit()
-    db.refresh(topping)
-    logging.info(f'Topping with ID {topping.id} updated successfully.')
-    return topping
+    if updated_id:
+        logger.info('Topping updated successfully (ID: %s)', topping_id)
+    else:
+        logger.info('No topping with ID %s and name %s, nothing updated.', topping_id, changed_topping.name)
+    return updated_id is not None
 
 
 def delete_topping_by_id(topping_id: uuid.UUID, db: Session):
-    logging.info(f'Deleting topping with ID: {topping_id}')
-    entity = get_topping_by_id(topping_id, db)
-    if entity:
-        db.delete(entity)
-        db.commit()
-        logging.info(f'Topping with ID {topping_id} deleted successfully.')
-    else:
-        logging.warning(f'Topping with ID {topping_id} not found, nothing to delete.')
+    logger.info('Deleting topping with ID: %s', topping_id)
+    deleted_id = db.execute(delete(Topping).where(Topping.id == topping_id).returning(Topping.id)).scalar()
+    db.commit()
+    if deleted_id:
+        logger.info('Topping with ID %s deleted successfully.', topping_id)
+        return True
+    logger.warning('Topping with ID %s not found, nothing to delete.', topping_id)
+    return False
@@ -8,33 +8,25 @@ from sqlalchemy.orm import Session
 
 import app.api.v1.endpoints.topping.crud as topping_crud
 from app.api.v1.endpoints.topping.schemas import ToppingSchema, ToppingCreateSchema, ToppingListItemSchema
-from app.database.connection import SessionLocal
+from app.api.v1.responses import orm_list_response, orm_response, url_for
+from app.api.deps import get_db
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 ITEM_NOT_FOUND = 'Item not found'
 
 router = APIRouter()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get('', response_model=List[ToppingListItemSchema], tags=['topping'])
 def get_all_toppings(db: Session = Depends(get_db)):
-    logging.info('Fetching all toppings.')
+    logger.info('Fetching all toppings.')
     toppings = topping_crud.get_all_toppings(db)
     if toppings:
-        logging.info(f'Total toppings fetched: {len(toppings)}')
+        logger.info('Total toppings fetched: %s', len(toppings))
     else:
-        logging.warning('No toppings found.')
-    return toppings
+        logger.warning('No toppings found.')
+    return orm_list_response(ToppingListItemSchema, toppings)
 
 
 @router.post('', response_model=ToppingSchema, status_code=status.HTTP_201_CREATED, tags=['topping'])
@@ -43,16 +35,16 @@ def create_topping(
         request: Request,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Attempting to create topping with name: {topping.name}')
-    topping_found = topping_crud.get_topping_by_name(topping.name, db)
+    logger.info('Attempting to create topping with name: %s', topping.name)
+    new_topping = topping_crud.create_topping(topping, db)
 
-    if topping_found:
-        logging.info(f'Topping already exists: {topping_found.name} (ID: {topping_found.id})')
-        url = request.url_for('get_topping', topping_id=topping_found.id)
+    if not new_topping:
+        topping_found = topping_crud.get_topping_by_name(topping.name, db)
+        logger.info('Topping already exists: %s (ID: %s)', topping_found.name, topping_found.id)
+        url = url_for(request, 'get_topping', topping_id=topping_found.id)
         return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
 
-    new_topping = topping_crud.create_topping(topping, db)
-    logging.info(f'Topping created successfully with ID: {new_topping.id}')
+    logger.info('Topping created successfully with ID: %s', new_topping.id)
     return new_topping
 
 
@@ -64,29 +56,25 @@ def update_topping(
         response: Response,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Updating topping with ID: {topping_id}')
+    logger.info('Updating topping with ID: %s', topping_id)
+    if topping_crud.update_topping_with_same_name(topping_id, changed_topping, db):
+        logger.info('Topping with ID %s updated in place.', topping_id)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
     topping_found = topping_crud.get_topping_by_id(topping_id, db)
-    updated_topping = None
-
-    if topping_found:
-        if topping_found.name == changed_topping.name:
-            logging.info(f'No changes in topping name for ID: {topping_id}')
-            topping_crud.update_topping(topping_found, changed_topping, db)
-            return Response(status_code=status.HTTP_204_NO_CONTENT)
-        else:
-            topping_name_found = topping_crud.get_topping_by_name(changed_topping.name, db)
-            if topping_name_found:
-                logging.info(f'Topping name conflict: {changed_topping.name} already exists.')
-                url = request.url_for('get_topping', topping_id=topping_name_found.id)
-                return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
-            else:
-                updated_topping = topping_crud.create_topping(changed_topping, db)
-                logging.info(f'Topping updated successfully with ID: {updated_topping.id}')
-                response.status_code = status.HTTP_201_CREATED
-    else:
-        logging.warning(f'Topping with ID {topping_id} not found.')
+    if not topping_found:
+        logger.warning('Topping with ID %s not found.', topping_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
+    updated_topping = topping_crud.create_topping(changed_topping, db)
+    if not updated_topping:
+        topping_name_found = topping_crud.get_topping_by_name(changed_topping.name, db)
+        logger.info('Topping name conflict: %s already exists.', changed_topping.name)
+        url = url_for(request, 'get_topping', topping_id=topping_name_found.id)
+        return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
+
+    logger.info('Topping updated successfully with ID: %s', updated_topping.id)
+    response.status_code = status.HTTP_201_CREATED
     return updated_topping
 
 
@@ -96,29 +84,26 @@ def get_topping(
         response: Response,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Fetching topping with ID: {topping_id}')
+    logger.info('Fetching topping with ID: %s', topping_id)
     topping = topping_crud.get_topping_by_id(topping_id, db)
 
     if not topping:
-        logging.warning(f'Topping with ID {topping_id} not found.')
+        logger.warning('Topping with ID %s not found.', topping_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    logging.info(f'Topping fetched successfully: {topping.name} (ID: {topping_id})')
-    return topping
+    logger.info('Topping fetched successfully: %s (ID: %s)', topping.name, topping_id)
+    return orm_response(ToppingSchema, topping)
 
 
-@router.delete('/{topping_id}', response_model=None, tags=['topping'])
+@router.delete('/{topping_id}', status_code=status.HTTP_204_NO_CONTENT, response_class=Response, tags=['topping'])
 def delete_topping(
         topping_id: uuid.UUID,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Deleting topping with ID: {topping_id}')
-    topping = topping_crud.get_topping_by_id(topping_id, db)
-
-    if not topping:
-        logging.warning(f'Topping with ID {topping_id} not found.')
+    logger.info('Deleting topping with ID: %s', topping_id)
+    if not topping_crud.delete_topping_by_id(topping_id, db):
+        logger.warning('Topping with ID %s not found.', topping_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    topping_crud.delete_topping_by_id(topping_id, db)
-    logging.info(f'Topping with ID {topping_id} deleted successfully.')
+    logger.info('Topping with ID %s deleted successfully.', topping_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
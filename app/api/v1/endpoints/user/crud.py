@@ -1,100 +1,101 @@
 import logging
 import uuid
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.api.v1.endpoints.user.schemas import UserCreateSchema
 from app.database.models import Order, User
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 
 def create_user(schema: UserCreateSchema, db: Session):
-    logging.info(f'Creating a new user with username: {schema.username}')
-    entity = User(**schema.dict())
+    logger.info('Creating a new user with username: %s', schema.username)
+    entity = User(username=schema.username)
     db.add(entity)
     db.commit()
-    logging.info(f'User created successfully with username: {entity.username} (ID: {entity.id})')
+    logger.info('User created successfully with username: %s (ID: %s)', entity.username, entity.id)
     return entity
 
 
 def get_user_by_username(username: str, db: Session):
-    logging.info(f'Fetching user with username: {username}')
-    entity = db.query(User).filter(User.username == username).first()
+    logger.info('Fetching user with username: %s', username)
+    entity = db.scalars(select(User).where(User.username == username)).first()
     if entity:
-        logging.info(f'User found: {entity.username} (ID: {entity.id})')
+        logger.info('User found: %s (ID: %s)', entity.username, entity.id)
     else:
-        logging.warning(f'User with username {username} not found.')
+        logger.warning('User with username %s not found.', username)
     return entity
 
 
 def get_user_by_id(user_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching user with ID: {user_id}')
-    entity = db.query(User).filter(User.id == user_id).first()
+    logger.info('Fetching user with ID: %s', user_id)
+    entity = db.get(User, user_id)
     if entity:
-        logging.info(f'User found: {entity.username} (ID: {user_id})')
+        logger.info('User found: %s (ID: %s)', entity.username, user_id)
     else:
-        logging.warning(f'User with ID {user_id} not found.')
+        logger.warning('User with ID %s not found.', user_id)
     return entity
 
 
 def get_all_users(db: Session):
-    logging.info('Fetching all users.')
-    entities = db.query(User).all()
+    logger.info('Fetching all users.')
+    entities = db.scalars(select(User)).all()
     if entities:
-        logging.info(f'Total users fetched: {len(entities)}')
+        logger.info('Total users fetched: %s', len(entities))
     else:
-        logging.warning('No users found in the database.')
+        logger.warning('No users found in the database.')
     return entities
 
 
 def update_user(user: User, changed_user: UserCreateSchema, db: Session):
-    logging.info(f'Updating user with ID: {user.id}')
-    for key, value in changed_user.dict().items():
-        logging.debug(f'Updating field {key} to value {value}')
+    logger.info('Updating user with ID: %s', user.id)
+    for key in changed_user.__fields_set__:
+        value = getattr(changed_user, key)
+        logger.debug('Updating field %s to value %s', key, value)
         setattr(user, key, value)
 
     db.commit()
     db.refresh(user)
-    logging.info(f'User with ID {user.id} updated successfully.')
+    logger.info('User with ID %s updated successfully.', user.id)
     return user
 
 
 def delete_user_by_id(user_id: uuid.UUID, db: Session):
-    logging.info(f'Deleting user with ID: {user_id}')
+    logger.info('Deleting user with ID: %s', user_id)
     entity = get_user_by_id(user_id, db)
     if entity:
         db.delete(entity)
         db.commit()
-        logging.info(f'User with ID {user_id} deleted successfully.')
+        logger.info('User with ID %s deleted successfully.', user_id)
     else:
-        logging.warning(f'User with ID {user_id} not found, nothing to delete.')
+        logger.warning('User with ID %s not found, nothing to delete.', user_id)
 
 
 def get_order_history_of_user(user_id: uuid.UUID, db: Session) -> list[Order]:
-    logging.info(f'Fetching completed order history for user ID: {user_id}')
+    logger.info('Fetching completed order history for user ID: %s', user_id)
     entities = db.query(Order).filter(Order.user_id == user_id, Order.order_status == 'COMPLETED').all()
     if entities:
-        logging.info(f'Total completed orders fetched for user ID {user_id}: {len(entities)}')
+        logger.info('Total completed orders fetched for user ID %s: %s', user_id, len(entities))
     else:
-        logging.warning(f'No completed orders found for user ID {user_id}.')
+        logger.warning('No completed orders found for user ID %s.', user_id)
     return entities
 
 
 def get_open_orders_of_user(user_id: uuid.UUID, db: Session):
-    logging.info(f'Fetching open orders for user ID: {user_id}')
+    logger.info('Fetching open orders for user ID: %s', user_id)
     entities = db.query(Order).filter(Order.user_id == user_id, Order.order_status != 'COMPLETED').all()
     if entities:
-        logging.info(f'Total open orders fetched for user ID {user_id}: {len(entities)}')
+        logger.info('Total open orders fetched for user ID %s: %s', user_id, len(entities))
     else:
-        logging.warning(f'No open orders found for user ID {user_id}.')
+        logger.warning('No open orders found for user ID %s.', user_id)
     return entities
 
 
 def get_all_not_completed_orders(db: Session):
-    logging.info('Fetching all not completed orders.')
+    logger.info('Fetching all not completed orders.')
     entities = db.query(Order).filter(Order.order_status != 'COMPLETED').all()
     if entities:
-        logging.info(f'Total not completed orders fetched: {len(entities)}')
+        logger.info('Total not completed orders fetched: %s', len(entities))
     else:
-        logging.warning('No not completed orders found.')
+        logger.warning('No not completed orders found.')
     return entities
@@ -8,42 +8,34 @@ from starlette.responses import Response
 
 import app.api.v1.endpoints.user.crud as user_crud
 from app.api.v1.endpoints.user.schemas import UserSchema, UserCreateSchema
-from app.database.connection import SessionLocal
+from app.api.v1.responses import orm_list_response, orm_response
+from app.api.deps import get_db
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 ITEM_NOT_FOUND = 'Item not found'
 
 router = APIRouter()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get('', response_model=List[UserSchema], tags=['user'])
 def get_all_users(
         db: Session = Depends(get_db),
 ):
-    logging.info('Fetching all users.')
+    logger.info('Fetching all users.')
     users = user_crud.get_all_users(db)
     if users:
-        logging.info(f'Total users fetched: {len(users)}')
+        logger.info('Total users fetched: %s', len(users))
     else:
-        logging.warning('No users found.')
-    return users
+        logger.warning('No users found.')
+    return orm_list_response(UserSchema, users)
 
 
 @router.post('', response_model=UserSchema, status_code=status.HTTP_201_CREATED, tags=['user'])
 def create_user(user: UserCreateSchema, db: Session = Depends(get_db)):
-    logging.info(f'Creating a new user with username: {user.username}')
+    logger.info('Creating a new user with username: %s', user.username)
     new_user = user_crud.create_user(user, db)
-    logging.info(f'User created successfully with username: {new_user.username} (ID: {new_user.id})')
+    logger.info('User created successfully with username: %s (ID: %s)', new_user.username, new_user.id)
     return new_user
 
 
@@ -53,15 +45,15 @@ def update_user(
         changed_user: UserCreateSchema,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Updating user with ID: {user_id}')
+    logger.info('Updating user with ID: %s', user_id)
     user_found = user_crud.get_user_by_id(user_id, db)
 
     if user_found:
         user_crud.update_user(user_found, changed_user, db)
-        logging.info(f'User with ID {user_id} updated successfully.')
+        logger.info('User with ID %s updated successfully.', user_id)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     else:
-        logging.error(f'User with ID {user_id} not found.')
+        logger.error('User with ID %s not found.', user_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
 
@@ -69,29 +61,29 @@ def update_user(
 def get_user(user_id: uuid.UUID,
              response: Response,
              db: Session = Depends(get_db)):
-    logging.info(f'Fetching user with ID: {user_id}')
+    logger.info('Fetching user with ID: %s', user_id)
     user_found = user_crud.get_user_by_id(user_id, db)
 
     if not user_found:
-        logging.warning(f'User with ID {user_id} not found.')
+        logger.warning('User with ID %s not found.', user_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
-    logging.info(f'User fetched successfully: {user_found.username} (ID: {user_id})')
-    return user_found
+    logger.info('User fetched successfully: %s (ID: %s)', user_found.username, user_id)
+    return orm_response(UserSchema, user_found)
 
 
-@router.delete('/{user_id}', response_model=None, tags=['user'])
+@router.delete('/{user_id}', status_code=status.HTTP_204_NO_CONTENT, response_class=Response, tags=['user'])
 def delete_user(
         user_id: uuid.UUID,
         db: Session = Depends(get_db),
 ):
-    logging.info(f'Deleting user with ID: {user_id}')
+    logger.info('Deleting user with ID: %s', user_id)
     user_found = user_crud.get_user_by_id(user_id, db)
 
     if not user_found:
-        logging.warning(f'User with ID {user_id} not found.')
+        logger.warning('User with ID %s not found.', user_id)
         raise HTTPException(status_code=404, detail=ITEM_NOT_FOUND)
 
     user_crud.delete_user_by_id(user_id, db)
-    logging.info(f'User with ID {user_id} deleted successfully.')
+    logger.info('User with ID %s deleted successfully.', user_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -8,6 +8,25 @@ DATABASE_URL = 'postgresql://' \
                + os.environ['DATABASE_PASSWORD'] + '@' \
                + os.environ['DATABASE_HOST'] + '/' \
                + os.environ['DATABASE_NAME']
-db_engine = create_engine(DATABASE_URL)
+
+# Connections one pod may open, split between its uvicorn worker processes. A rolling update runs two pods,
+# 2 x 40 stays below the default max_connections of 100 and leaves room for migrations and admin sessions.
+CONNECTION_LIMIT = int(os.environ.get('DATABASE_CONNECTION_LIMIT', 40))
+WORKER_PROCESSES = int(os.environ.get('WEB_CONCURRENCY', 1))
+POOL_SIZE = max(1, CONNECTION_LIMIT // WORKER_PROCESSES // 2)
+MAX_OVERFLOW = max(0, CONNECTION_LIMIT // WORKER_PROCESSES - POOL_SIZE)
+# Compiled statements kept per process, sized above the distinct statements the crud modules emit
+QUERY_CACHE_SIZE = 1200
+
+# Sized pool shared by the request worker threads, stale connections are detected before use
+db_engine = create_engine(
+    DATABASE_URL,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    insertmanyvalues_page_size=1000,
+    query_cache_size=QUERY_CACHE_SIZE,
+)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
@@ -0,0 +1,28 @@
+"""index pizza order_id
+
+Revision ID: 8f2d1c7a9b31
+Revises: 37c8c544218f
+Create Date: 2025-02-03 10:12:08.341927
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f2d1c7a9b31'
+down_revision = '37c8c544218f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_pizza_order_id'), 'pizza', ['order_id'], unique=False,
+                        postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_pizza_order_id'), table_name='pizza', postgresql_concurrently=True)
@@ -0,0 +1,34 @@
+"""index customer_order user_id and order_status
+
+Revision ID: b3e51f0c27d4
+Revises: 8f2d1c7a9b31
+Create Date: 2025-02-10 09:41:27.118305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e51f0c27d4'
+down_revision = '8f2d1c7a9b31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_customer_order_user_id_order_status', 'customer_order', ['user_id', 'order_status'],
+                        unique=False, postgresql_concurrently=True)
+        op.create_index('ix_customer_order_open_order_status_id', 'customer_order', ['order_status', 'id'],
+                        unique=False, postgresql_concurrently=True,
+                        postgresql_where=sa.text("order_status != 'COMPLETED'"))
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_customer_order_open_order_status_id', table_name='customer_order',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_customer_order_user_id_order_status', table_name='customer_order',
+                      postgresql_concurrently=True)
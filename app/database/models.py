@@ -4,7 +4,7 @@ import enum
 import uuid
 from typing import List
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, Numeric, DateTime, String
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, Numeric, DateTime, String, text
 from sqlalchemy.orm import relationship, mapped_column, Mapped, DeclarativeBase
 from sqlalchemy.sql import func
 
@@ -133,6 +133,14 @@ class Order(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('user.id'), nullable=False)
     order_status: Mapped[OrderStatus] = mapped_column(default=OrderStatus.TRANSMITTED, nullable=False)
 
+    __table_args__ = (
+        # Order history and open orders of a user
+        Index('ix_customer_order_user_id_order_status', 'user_id', 'order_status'),
+        # Completed orders pile up, the open ones are few and listed by status, paged by id
+        Index('ix_customer_order_open_order_status_id', 'order_status', 'id',
+              postgresql_where=text("order_status != 'COMPLETED'")),
+    )
+
     def __repr__(self):
         return "Order(id='%s', order_datetime='%s' beverages='%s', pizzas='%s', user='%s', \
         order_status='%s')" \
@@ -145,7 +153,7 @@ class Pizza(Base):
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     pizza_type_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('pizza_type.id'), nullable=False)
     pizza_type: Mapped['PizzaType'] = relationship()
-    order_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('customer_order.id'), nullable=True)
+    order_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('customer_order.id'), nullable=True, index=True)
 
     def __repr__(self):
         return "Pizza(id='%s', pizza_type_id='%s', order_id='%s')" \
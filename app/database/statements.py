@@ -0,0 +1,14 @@
+from typing import List
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def insert_on_conflict_do_nothing(db: Session, model, values, index_elements: List[str]):
+    # ON CONFLICT is dialect specific, production runs on postgres while some tests use sqlite
+    if db.get_bind().dialect.name == 'sqlite':
+        insert = sqlite.insert
+    else:
+        insert = postgresql.insert
+
+    return insert(model).values(values).on_conflict_do_nothing(index_elements=index_elements)
@@ -1,11 +1,30 @@
 import logging
+import logging.config
+import os
+
+import anyio
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.v1.responses import DecimalORJSONResponse
 from app.api.v1.router import router as api_v1_router
+from app.database.connection import POOL_SIZE, MAX_OVERFLOW
+
+# Logging is configured once here, modules only create their loggers. Production sets LOG_LEVEL=WARNING.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 
-logging.basicConfig(format='%(asctime)s:%(levelname)s:%(message)s', level=logging.DEBUG)  # NOSONAR
+logging.config.dictConfig({  # NOSONAR
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'default': {'format': '%(asctime)s:%(levelname)s:%(message)s'},
+    },
+    'handlers': {
+        'default': {'class': 'logging.StreamHandler', 'formatter': 'default'},
+    },
+    'root': {'level': LOG_LEVEL, 'handlers': ['default']},
+})
 
 tags_metadata = [
     {
@@ -34,7 +53,7 @@ tags_metadata = [
     },
 ]
 
-app = FastAPI(openapi_tags=tags_metadata)
+app = FastAPI(openapi_tags=tags_metadata, default_response_class=DecimalORJSONResponse)
 
 origins = [
     'http://localhost',
@@ -50,6 +69,13 @@ app.add_middleware(
     expose_headers=[],
 )
 
+
+@app.on_event('startup')
+def limit_worker_threads():
+    # The sync endpoints run in a thread pool, more threads than connections would only wait on the pool
+    anyio.to_thread.current_default_thread_limiter().total_tokens = POOL_SIZE + MAX_OVERFLOW
+
+
 # This function routes to version 1 of the REST API /v1/..
 app.include_router(
     api_v1_router,
@@ -58,4 +84,4 @@ app.include_router(
 
 if __name__ == '__main__':
     logging.info('App is up and running')
-    uvicorn.run('app.main:app', host='0.0.0.0', port=8000)
+    uvicorn.run('app.main:app', host='0.0.0.0', port=8000, loop='uvloop', http='httptools')
@@ -4,7 +4,8 @@ set -e
 
 if [ -z "${1-}" ];
 then
-cmd="uvicorn --host 0.0.0.0 app.main:app"
+# uvloop and httptools instead of asyncio and h11, the worker count comes from WEB_CONCURRENCY
+cmd="uvicorn --host 0.0.0.0 --loop uvloop --http httptools app.main:app"
 else	cmd="$@"
 fi
 exec $cmd
@@ -0,0 +1,167 @@
+import os
+import secrets
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.database.models import Address, Base, Beverage, Dough, Order, Sauce, User
+
+
+# The tests run on one in-memory SQLite database by default, which is quick to set up locally. TEST_DATABASE_URL
+# points them at a migrated Postgres database instead, CI runs them there to cover the Postgres specific SQL.
+TEST_DATABASE_URL = os.environ.get('TEST_DATABASE_URL')
+
+
+def create_sqlite_engine():
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+
+    # pysqlite starts transactions on its own and breaks SAVEPOINT, SQLAlchemy emits BEGIN instead
+    @event.listens_for(engine, 'connect')
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def do_begin(connection):
+        connection.exec_driver_sql('BEGIN')
+
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+# One database for the whole test run, the schema is only set up once
+@pytest.fixture(scope='session')
+def database_engine():
+    engine = create_engine(TEST_DATABASE_URL) if TEST_DATABASE_URL else create_sqlite_engine()
+    yield engine
+    engine.dispose()
+
+
+# One connection for the whole run, its outer transaction is never committed
+@pytest.fixture(scope='session')
+def database_connection(database_engine):
+    connection = database_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+# Builds the rows shared by all tests, the fixtures hand out plain rows that outlive the session
+@pytest.fixture(scope='session')
+def baseline_db(database_connection):
+    db = Session(bind=database_connection, autoflush=False, join_transaction_mode='create_savepoint')
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Everything a test writes lives in a savepoint on top of the shared rows and is rolled back afterwards,
+# commits of the crud functions only release nested savepoints. Flushing and expiring on commit are set up
+# like SessionLocal of the app, so lazy loads after a commit and missing flushes show up in the tests.
+@pytest.fixture
+def db_session(database_connection, baseline_db):
+    baseline_db.close()
+    savepoint = database_connection.begin_nested()
+    db = Session(bind=database_connection, autoflush=False, join_transaction_mode='create_savepoint')
+    try:
+        yield db
+    finally:
+        db.close()
+        savepoint.rollback()
+
+
+# Suffix for the unique names of the rows created by the tests, drawn once per run instead of once per name
+@pytest.fixture(scope='session')
+def name_suffix():
+    return secrets.token_hex(8)
+
+
+# The rows the tests build on are inserted with plain INSERT ... RETURNING statements, only their ids are needed,
+# the crud functions that create them are covered by their own tests
+@pytest.fixture(scope='function')
+def dummy_sauce(db_session):
+    initial_data = {
+        'name': 'Test Sauce',
+        'description': 'A test sauce description.',
+    }
+
+    yield db_session.execute(insert(Sauce).values(initial_data).returning(Sauce.id)).one()
+
+
+@pytest.fixture(scope='session')
+def dummy_user(baseline_db: Session, name_suffix):
+    """
+    Fixture for creating a dummy user shared by all tests.
+    """
+    unique_username = f'test_user_{name_suffix}'
+    user = baseline_db.execute(insert(User).values(username=unique_username).returning(User.id)).one()
+    baseline_db.commit()
+    yield user
+
+
+@pytest.fixture(scope='session')
+def unique_dough(baseline_db: Session, name_suffix):
+    """
+    Fixture for creating a unique dough for testing purposes.
+    It is created once for the whole run with a unique name to prevent data collisions.
+    """
+    dough_name = f'Test Dough {name_suffix}'
+    initial_data = {
+        'name': dough_name,
+        'price': Decimal('3.50'),
+        'description': 'A unique test dough description.',
+        'stock': 100,
+    }
+    dough = baseline_db.execute(insert(Dough).values(initial_data).returning(Dough.id)).one()
+    baseline_db.commit()
+    yield dough
+
+
+@pytest.fixture(scope='session')
+def dummy_beverage(baseline_db: Session, name_suffix):
+    """
+    Fixture for creating a unique beverage shared by all tests.
+    """
+    beverage_name = f'Coke {name_suffix}'
+    initial_data = {
+        'name': beverage_name,
+        'price': Decimal('3.50'),
+        'description': 'A refreshing test beverage.',
+        'stock': 100,
+    }
+    beverage = baseline_db.execute(insert(Beverage).values(initial_data).returning(Beverage.id)).one()
+    baseline_db.commit()
+    yield beverage
+
+
+@pytest.fixture(scope='module')
+def prepared_order(database_connection, dummy_user, unique_dough, dummy_beverage):
+    """
+    Fixture for an order of the dummy user that the tests of a module add pizzas and beverages to.
+    It is created once in a savepoint that is rolled back when the module is done.
+    The shared rows are requested first, created inside the savepoint they would be rolled back with it.
+    """
+    savepoint = database_connection.begin_nested()
+    address_data = {
+        'street': 'Second St',
+        'house_number': 24,
+        'post_code': '54321',
+        'town': 'Sample Town',
+        'country': 'Sample Country',
+        'first_name': 'Jane',
+        'last_name': 'Smith',
+    }
+    address_id = database_connection.execute(insert(Address).values(address_data).returning(Address.id)).scalar_one()
+    order = database_connection.execute(
+        insert(Order).values(user_id=dummy_user.id, address_id=address_id).returning(Order.id),
+    ).one()
+    try:
+        yield order
+    finally:
+        savepoint.rollback()
@@ -1,7 +1,3 @@
-import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.database.models import Base
 from app.api.v1.endpoints.order.address.schemas import AddressCreateSchema
 from app.api.v1.endpoints.order.address.crud import (
     create_address,
@@ -12,18 +8,7 @@ from app.api.v1.endpoints.order.address.crud import (
 )
 
 
-# Test database setup
-@pytest.fixture(scope='module')
-def test_db():
-    engine = create_engine('sqlite:///:memory:')
-    Base.metadata.create_all(bind=engine)
-    testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = testing_session_local()
-    yield db
-    db.close()
-
-
-def test_address_crud_operations(test_db):
+def test_address_crud_operations(db_session):
     # Create Address
     address_data = AddressCreateSchema(
         street='Main St',
@@ -34,12 +19,12 @@ def test_address_crud_operations(test_db):
         first_name='John',
         last_name='Doe',
     )
-    new_address = create_address(address_data, test_db)
+    new_address = create_address(address_data, db_session)
     assert new_address.id is not None
     assert new_address.street == 'Main St'
 
     # Get Address by ID
-    fetched_address = get_address_by_id(new_address.id, test_db)
+    fetched_address = get_address_by_id(new_address.id, db_session)
     assert fetched_address.id == new_address.id
 
     # Update Address
@@ -52,15 +37,15 @@ def test_address_crud_operations(test_db):
         first_name='Jane',
         last_name='Doe',
     )
-    updated_address = update_address(fetched_address, updated_data, test_db)
+    updated_address = update_address(fetched_address, updated_data, db_session)
     assert updated_address.street == 'Updated St'
     assert updated_address.first_name == 'Jane'
 
     # Get All Addresses
-    all_addresses = get_all_addresses(test_db)
+    all_addresses = get_all_addresses(db_session)
     assert len(all_addresses) == 1
 
     # Delete Address
-    delete_address_by_id(updated_address.id, test_db)
-    deleted_address = get_address_by_id(updated_address.id, test_db)
+    delete_address_by_id(updated_address.id, db_session)
+    deleted_address = get_address_by_id(updated_address.id, db_session)
     assert deleted_address is None
@@ -1,31 +1,21 @@
 import uuid
-import pytest
 from decimal import Decimal
 
 from app.api.v1.endpoints.beverage.crud import (
+    bulk_create_beverages,
     create_beverage,
     get_beverage_by_id,
     get_beverage_by_name,
+    get_beverage_id_by_name,
     get_all_beverages,
-    update_beverage,
+    update_beverage_with_same_name,
     delete_beverage_by_id,
 )
 from app.api.v1.endpoints.beverage.schemas import BeverageCreateSchema
-from app.database.connection import SessionLocal
 
 
-# Fixture for database connection
-@pytest.fixture(scope='module')
-def db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-def test_beverage_crud_operations(db):
-    # Arrange: Define initial and updated test data
+def test_beverage_crud_operations(db_session):
+    # Arrange: Define initial and updated test data, the update keeps the name
     initial_data = {
         'name': 'Test Beverage',
         'price': Decimal('3.50'),
@@ -33,14 +23,14 @@ def test_beverage_crud_operations(db):
         'stock': 100,
     }
     updated_data = {
-        'name': 'Updated Beverage',
+        'name': 'Test Beverage',
         'price': Decimal('4.00'),
         'description': 'An updated refreshing beverage.',
         'stock': 90,
     }
 
     # Act: Create a new beverage
-    created_beverage = create_beverage(BeverageCreateSchema(**initial_data), db)
+    created_beverage = create_beverage(BeverageCreateSchema(**initial_data), db_session)
 
     # Assert: Verify creation
     assert created_beverage.name == initial_data['name']
@@ -50,65 +40,67 @@ def test_beverage_crud_operations(db):
     assert isinstance(created_beverage.id, uuid.UUID)
 
     # Act: Fetch beverage by ID
-    fetched_beverage = get_beverage_by_id(created_beverage.id, db)
+    fetched_beverage = get_beverage_by_id(created_beverage.id, db_session)
 
     # Assert: Verify fetching by ID
     assert fetched_beverage is not None
     assert fetched_beverage.name == initial_data['name']
 
     # Act: Fetch beverage by name
-    fetched_by_name = get_beverage_by_name(initial_data['name'], db)
+    fetched_by_name = get_beverage_by_name(initial_data['name'], db_session)
 
     # Assert: Verify fetching by name
     assert fetched_by_name is not None
     assert fetched_by_name.id == created_beverage.id
 
-    # Act: Update the beverage
-    updated_beverage = update_beverage(fetched_beverage, BeverageCreateSchema(**updated_data), db)
+    # Act & Assert: Fetch only the beverage ID by name
+    assert get_beverage_id_by_name(initial_data['name'], db_session) == created_beverage.id
+
+    # Act: Update the beverage in place, like PUT does while the name is unchanged
+    assert update_beverage_with_same_name(created_beverage.id, BeverageCreateSchema(**updated_data), db_session)
+    db_session.refresh(fetched_beverage)
 
     # Assert: Verify update
-    assert updated_beverage.name == updated_data['name']
-    assert updated_beverage.price == updated_data['price']
-    assert updated_beverage.description == updated_data['description']
-    assert updated_beverage.stock == updated_data['stock']
+    assert fetched_beverage.name == updated_data['name']
+    assert fetched_beverage.price == updated_data['price']
+    assert fetched_beverage.description == updated_data['description']
+    assert fetched_beverage.stock == updated_data['stock']
+
+    # Act & Assert: A rename is not updated in place
+    renamed_data = {**updated_data, 'name': 'Updated Beverage'}
+    assert not update_beverage_with_same_name(created_beverage.id, BeverageCreateSchema(**renamed_data), db_session)
 
     # Act: Delete the beverage
-    delete_beverage_by_id(updated_beverage.id, db)
+    delete_beverage_by_id(created_beverage.id, db_session)
 
     # Assert: Verify deletion
-    assert get_beverage_by_id(updated_beverage.id, db) is None
+    assert get_beverage_by_id(created_beverage.id, db_session) is None
 
 
 # Test fetching all beverages
-def test_get_all_beverages(db):
-    # Cleanup: Remove any existing test data
-    for beverage_name in ['Beverage 1', 'Beverage 2']:
-        existing_beverage = get_beverage_by_name(beverage_name, db)
-        if existing_beverage:
-            delete_beverage_by_id(existing_beverage.id, db)
-
+def test_get_all_beverages(db_session):
     # Arrange: Add multiple beverages
-    beverage1 = create_beverage(
+    create_beverage(
         BeverageCreateSchema(
             name='Beverage 1',
             price=Decimal('1.50'),
             description='A tasty beverage.',
             stock=50,
         ),
-        db,
+        db_session,
     )
-    beverage2 = create_beverage(
+    create_beverage(
         BeverageCreateSchema(
             name='Beverage 2',
             price=Decimal('2.50'),
             description='A refreshing beverage.',
             stock=75,
         ),
-        db,
+        db_session,
     )
 
     # Act: Fetch all beverages
-    beverages = get_all_beverages(db)
+    beverages = get_all_beverages(db_session)
 
     # Assert: Ensure the added beverages are in the list
     assert len(beverages) >= 2
@@ -116,6 +108,22 @@ def test_get_all_beverages(db):
     assert 'Beverage 1' in beverage_names
     assert 'Beverage 2' in beverage_names
 
-    # Cleanup: Delete added beverages
-    delete_beverage_by_id(beverage1.id, db)
-    delete_beverage_by_id(beverage2.id, db)
+
+# Test creating many beverages at once
+def test_bulk_create_beverages(db_session):
+    # Arrange: One of the beverages already exists
+    existing_beverage = create_beverage(
+        BeverageCreateSchema(name='Bulk Beverage 2', price=Decimal('2.50'), description='Existing.', stock=75),
+        db_session,
+    )
+    schemas = [
+        BeverageCreateSchema(name='Bulk Beverage 1', price=Decimal('1.50'), description='New.', stock=50),
+        BeverageCreateSchema(name='Bulk Beverage 2', price=Decimal('9.99'), description='Duplicate.', stock=1),
+    ]
+
+    # Act: Create the beverages in one go
+    created_beverages = bulk_create_beverages(schemas, db_session)
+
+    # Assert: Only the new beverage is created, the existing one is untouched
+    assert [b.name for b in created_beverages] == ['Bulk Beverage 1']
+    assert get_beverage_by_id(existing_beverage.id, db_session).price == Decimal('2.50')
@@ -0,0 +1,43 @@
+from decimal import Decimal
+
+import pytest
+
+from app.api.v1.endpoints.order.crud import (
+    get_all_pizzas_of_order,
+    get_joined_beverage_quantities_by_order,
+    get_price_of_order,
+)
+from app.database.models import OrderBeverageQuantity, Pizza, PizzaType
+
+# Benchmarks are disabled by default and run once like any other test, the nightly job times them on Postgres
+# with --benchmark-enable and flags a median more than 50% slower than the last saved run
+pytestmark = pytest.mark.benchmark(disable_gc=True, warmup=True, warmup_iterations=2)
+
+NUMBER_OF_PIZZAS = 20
+
+
+@pytest.fixture
+def filled_order(db_session, prepared_order, unique_dough, dummy_beverage):
+    pizza_type = PizzaType(name='Benchmark Pizza', price=Decimal('8.50'), dough_id=unique_dough.id)
+    db_session.add_all([Pizza(order_id=prepared_order.id, pizza_type=pizza_type) for _ in range(NUMBER_OF_PIZZAS)])
+    db_session.add(OrderBeverageQuantity(order_id=prepared_order.id, beverage_id=dummy_beverage.id, quantity=3))
+    db_session.flush()
+    return prepared_order
+
+
+def test_get_price_of_order_benchmark(benchmark, db_session, filled_order):
+    price = benchmark(get_price_of_order, filled_order.id, db_session)
+
+    assert price == NUMBER_OF_PIZZAS * Decimal('8.50') + 3 * Decimal('3.50')
+
+
+def test_get_all_pizzas_of_order_benchmark(benchmark, db_session, filled_order):
+    pizzas = benchmark(get_all_pizzas_of_order, filled_order, db_session)
+
+    assert len(pizzas) == NUMBER_OF_PIZZAS
+
+
+def test_get_joined_beverage_quantities_by_order_benchmark(benchmark, db_session, filled_order):
+    beverages = benchmark(get_joined_beverage_quantities_by_order, filled_order.id, db_session)
+
+    assert [beverage.quantity for beverage in beverages] == [3]
@@ -1,4 +1,3 @@
-import pytest
 from decimal import Decimal
 from uuid import uuid4
 import app.api.v1.endpoints.topping.crud as topping_crud
@@ -8,53 +7,24 @@ from app.api.v1.endpoints.topping.schemas import ToppingCreateSchema
 from app.api.v1.endpoints.pizza_type.crud import (
     create_pizza_type,
     get_pizza_type_by_id,
+    get_pizza_type_by_id_with_relations,
     delete_pizza_type_by_id,
     get_all_pizza_types,
-    update_pizza_type,
+    update_pizza_type_with_same_name,
     get_pizza_type_by_name,
     create_topping_quantity,
     get_topping_quantity_by_id,
+    get_topping_quantity_references,
 )
 from app.api.v1.endpoints.pizza_type.schemas import (
     PizzaTypeCreateSchema,
     PizzaTypeToppingQuantityCreateSchema,
 )
-from app.api.v1.endpoints.dough.crud import (
-    create_dough,
-    get_dough_by_name,
-    delete_dough_by_id,
-)
+from app.api.v1.endpoints.dough.crud import create_dough
 
-from app.api.v1.endpoints.sauce.crud import create_sauce, get_sauce_by_name, delete_sauce_by_id
+from app.api.v1.endpoints.sauce.crud import create_sauce
 from app.api.v1.endpoints.dough.schemas import DoughCreateSchema
-from app.database.connection import SessionLocal
-
-
-@pytest.fixture(scope='module')
-def db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-def cleanup_dough(name: str, db):
-    existing_dough = get_dough_by_name(name, db)
-    if existing_dough:
-        delete_dough_by_id(existing_dough.id, db)
-
-
-def cleanup_topping(name: str, db):
-    existing_topping = topping_crud.get_topping_by_name(name, db)
-    if existing_topping:
-        topping_crud.delete_topping_by_id(existing_topping.id, db)
-
-
-def cleanup_sauce(name: str, db):
-    existing_sauce = get_sauce_by_name(name, db)
-    if existing_sauce:
-        delete_sauce_by_id(existing_sauce.id, db)
+from sqlalchemy.orm import Session
 
 
 def create_dummy_dough(db):
@@ -86,17 +56,13 @@ def create_dummy_topping(db):
     return topping_crud.create_topping(ToppingCreateSchema(**initial_data), db)
 
 
-def test_pizza_type_crud_operations(db):
-    # Step 1: Create a dummy dough entry
-    dummy_dough_name = 'Test Dough'
-    cleanup_dough(dummy_dough_name, db)
-    dough = create_dummy_dough(db)
-    sauce = create_dummy_sauce(db)
+def test_pizza_type_crud_operations(db_session):
+    # Step 1: Create a dummy dough entry, rows of earlier tests are rolled back with their savepoint
+    dough = create_dummy_dough(db_session)
+    sauce = create_dummy_sauce(db_session)
 
     # Step 2: Create a dummy topping
-    dummy_topping_name = 'Test Topping'
-    cleanup_topping(dummy_topping_name, db)
-    topping = create_dummy_topping(db)
+    topping = create_dummy_topping(db_session)
 
     # Step 3: Create a pizza type
     pizza_schema = PizzaTypeCreateSchema(
@@ -106,43 +72,49 @@ def test_pizza_type_crud_operations(db):
         default_sauce_id=sauce.id,
         dough_id=dough.id,
     )
-    created_pizza = create_pizza_type(pizza_schema, db)
+    created_pizza = create_pizza_type(pizza_schema, db_session)
 
     # Retrieve pizza by name
-    pizza_retrieved_with_name = get_pizza_type_by_name('Test Pizza', db)
+    pizza_retrieved_with_name = get_pizza_type_by_name('Test Pizza', db_session)
 
     # Assertions for pizza creation
     assert pizza_retrieved_with_name is not None, 'Failed to retrieve pizza by name.'
     assert pizza_retrieved_with_name.name == created_pizza.name
     assert created_pizza.id is not None, 'Pizza ID should not be None after creation.'
     assert created_pizza.price == Decimal('12.99'), 'Pizza price mismatch.'
+    assert create_pizza_type(pizza_schema, db_session) is None, 'A pizza type name must only be created once.'
 
     # Step 4: Retrieve the pizza type by ID
-    fetched_pizza = get_pizza_type_by_id(created_pizza.id, db)
+    fetched_pizza = get_pizza_type_by_id(created_pizza.id, db_session)
 
     # Assertions for pizza retrieval
     assert fetched_pizza is not None, 'Failed to retrieve pizza by ID.'
     assert fetched_pizza.name == 'Test Pizza', 'Pizza name mismatch.'
 
-    # Step 5: Update the pizza type
+    # Step 5: Update the pizza type in place, like PUT does while the name is unchanged
     updated_schema = PizzaTypeCreateSchema(
-        name='Updated Pizza',
+        name='Test Pizza',
         price=Decimal('15.99'),
         description='An updated test pizza',
         dough_id=dough.id,
     )
-    updated_pizza = update_pizza_type(fetched_pizza, updated_schema, db)
+    assert update_pizza_type_with_same_name(created_pizza.id, updated_schema, db_session), \
+        'Same name should update in place.'
+    db_session.refresh(fetched_pizza)
 
     # Assertions for pizza update
-    assert updated_pizza.name == 'Updated Pizza', 'Pizza name was not updated correctly.'
-    assert updated_pizza.price == Decimal('15.99'), 'Pizza price mismatch.'
+    assert fetched_pizza.price == Decimal('15.99'), 'Pizza price mismatch.'
+    assert fetched_pizza.description == 'An updated test pizza', 'Pizza description was not updated correctly.'
+    renamed_schema = updated_schema.copy(update={'name': 'Updated Pizza'})
+    assert not update_pizza_type_with_same_name(created_pizza.id, renamed_schema, db_session), \
+        'A rename must not update.'
 
     # Step 6: Add a topping quantity
     topping_quantity_schema = PizzaTypeToppingQuantityCreateSchema(
         quantity=10,
         topping_id=topping.id,
     )
-    topping_quantity = create_topping_quantity(updated_pizza, topping_quantity_schema, db)
+    topping_quantity = create_topping_quantity(created_pizza.id, topping_quantity_schema, db_session)
 
     # Assertions for topping quantity creation
     assert topping_quantity is not None, 'Failed to create topping quantity.'
@@ -150,27 +122,39 @@ def test_pizza_type_crud_operations(db):
     assert topping_quantity.topping_id == topping.id, 'Topping ID mismatch.'
 
     # Verify topping quantity retrieval
-    fetched_topping_quantity = get_topping_quantity_by_id(updated_pizza.id, topping.id, db)
+    fetched_topping_quantity = get_topping_quantity_by_id(created_pizza.id, topping.id, db_session)
     assert fetched_topping_quantity is not None, 'Failed to retrieve topping quantity.'
     assert fetched_topping_quantity.quantity == 10, 'Retrieved topping quantity mismatch.'
+    assert tuple(get_topping_quantity_references(created_pizza.id, topping.id, db_session)) == (True, True, True)
+    assert tuple(get_topping_quantity_references(created_pizza.id, uuid4(), db_session)) == (True, False, False)
+
+    # Toppings and dough are loaded together with the pizza type, a second session on the connection sees the rows
+    other_db = Session(bind=db_session.connection(), join_transaction_mode='rollback_only')
+    try:
+        pizza_with_relations = get_pizza_type_by_id_with_relations(created_pizza.id, other_db)
+        assert {'toppings', 'dough'} <= pizza_with_relations.__dict__.keys(), 'Relationships should be eager.'
+        assert [quantity.topping_id for quantity in pizza_with_relations.toppings] == [topping.id]
+        assert pizza_with_relations.dough.id == dough.id
+        assert get_pizza_type_by_id_with_relations(uuid4(), other_db) is None
+
+        # The plain getter leaves the relationships to be loaded on access
+        other_db.expunge_all()
+        plain_pizza = get_pizza_type_by_id(created_pizza.id, other_db)
+        assert not {'toppings', 'dough'} & plain_pizza.__dict__.keys(), 'Relationships should be lazy.'
+    finally:
+        other_db.close()
 
     # Step 7: Test retrieval of all pizza types
-    all_pizzas = get_all_pizza_types(db)
+    all_pizzas = get_all_pizza_types(db_session)
     assert len(all_pizzas) >= 1, 'Failed to retrieve all pizza types.'
-    assert any(pizza.name == 'Updated Pizza' for pizza in all_pizzas), 'Updated pizza not found.'
+    assert any(pizza.price == Decimal('15.99') for pizza in all_pizzas if pizza.id == created_pizza.id), \
+        'Updated pizza not found.'
 
     # Step 8: Negative case - Retrieve non-existent pizza
-    non_existent_pizza = get_pizza_type_by_id(uuid4(), db)
+    non_existent_pizza = get_pizza_type_by_id(uuid4(), db_session)
     assert non_existent_pizza is None, 'Non-existent pizza retrieval should return None.'
 
-    # Cleanup
-    delete_pizza_type_by_id(created_pizza.id, db)
-    delete_dough_by_id(dough.id, db)
-    topping_crud.delete_topping_by_id(topping.id, db)
-    delete_sauce_by_id(sauce.id, db)
-
-    # Verify cleanup
-    db.commit()
-    assert get_pizza_type_by_id(created_pizza.id, db) is None, 'Pizza was not deleted during cleanup.'
-    assert get_dough_by_name(dummy_dough_name, db) is None, 'Dough was not deleted during cleanup.'
-    assert topping_crud.get_topping_by_name(dummy_topping_name, db) is None, 'Topping was not deleted during cleanup.'
+    # Step 9: Delete the pizza type together with its topping quantities
+    assert delete_pizza_type_by_id(created_pizza.id, db_session), 'Pizza type with toppings should be deleted.'
+    assert not delete_pizza_type_by_id(created_pizza.id, db_session), 'Deleting a missing pizza type should report it.'
+    assert get_pizza_type_by_id(created_pizza.id, db_session) is None, 'Pizza was not deleted.'
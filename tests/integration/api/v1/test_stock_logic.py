@@ -1,43 +1,103 @@
 import uuid
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.database.models import Base, Beverage
-from app.api.v1.endpoints.order.stock_logic.stock_beverage_crud import beverage_is_available, change_stock_of_beverage
-
-
-# Test database setup
-@pytest.fixture(scope='module')
-def test_db():
-    engine = create_engine('sqlite:///:memory:')
-    Base.metadata.create_all(bind=engine)
-    testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = testing_session_local()
-    yield db
-    db.close()
-
-
-def test_beverage_stock_logic(test_db):
-    # Setup test data
-    beverage_id = uuid.uuid4()
-    beverage = Beverage(id=beverage_id, name='Coke', stock=10, price=2.5)
-    test_db.add(beverage)
-    test_db.commit()
-
-    # Test beverage availability
-    assert beverage_is_available(beverage_id, 5, test_db)  # Should be True
-    assert not beverage_is_available(beverage_id, 15, test_db)  # Should be False
-    assert beverage_is_available(beverage_id, 10, test_db)  # Should be True
-
-    # Test stock change
-    assert change_stock_of_beverage(beverage_id, -5, test_db)  # Reduce stock
-    updated_beverage = test_db.query(Beverage).filter(Beverage.id == beverage_id).first()
-    assert updated_beverage.stock == 5
-
-    assert not change_stock_of_beverage(beverage_id, -10, test_db)  # Can't reduce below 0
-    updated_beverage = test_db.query(Beverage).filter(Beverage.id == beverage_id).first()
-    assert updated_beverage.stock == 5
-
-    assert change_stock_of_beverage(beverage_id, 5, test_db)  # Increase stock
-    updated_beverage = test_db.query(Beverage).filter(Beverage.id == beverage_id).first()
-    assert updated_beverage.stock == 10
+from app.database.models import Beverage, Dough, PizzaType, Topping, PizzaTypeToppingQuantity
+from app.api.v1.endpoints.order.stock_logic.stock_beverage_crud import beverage_is_available, \
+    change_stock_of_beverage, consume_beverages, restore_beverages, try_consume_beverage
+from app.api.v1.endpoints.order.stock_logic.stock_ingredients_crud import restore_ingredients_of_pizza_types, \
+    try_consume_ingredients
+
+
+@pytest.mark.parametrize('amount, available', [
+    (5, True),
+    (15, False),
+    (10, True),  # Stock can be used up completely
+])
+def test_beverage_is_available(db_session, amount, available):
+    beverage = Beverage(id=uuid.uuid4(), name='Coke', stock=10, price=2.5)
+    db_session.add(beverage)
+    db_session.commit()
+
+    assert beverage_is_available(beverage.id, amount, db_session) is available
+
+
+@pytest.mark.parametrize('stock, change_amount, changed, expected_stock', [
+    (10, -5, True, 5),  # Reduce stock
+    (5, -10, False, 5),  # Can't reduce below 0
+    (5, 5, True, 10),  # Increase stock
+])
+def test_change_stock_of_beverage(db_session, stock, change_amount, changed, expected_stock):
+    beverage = Beverage(id=uuid.uuid4(), name='Coke', stock=stock, price=2.5)
+    db_session.add(beverage)
+    db_session.commit()
+
+    assert change_stock_of_beverage(beverage.id, change_amount, db_session) is changed
+    db_session.refresh(beverage, attribute_names=['stock'])
+    assert beverage.stock == expected_stock
+
+
+def test_consume_beverages(db_session):
+    cola = Beverage(id=uuid.uuid4(), name='Cola', stock=4, price=2.5)
+    water = Beverage(id=uuid.uuid4(), name='Water', stock=1, price=1.5)
+    db_session.add_all([cola, water])
+    db_session.commit()
+
+    assert not consume_beverages({cola.id: 3, water.id: 2}, db_session)  # Not enough water
+    db_session.rollback()
+    assert db_session.get(Beverage, cola.id).stock == 4
+
+    assert consume_beverages({cola.id: 3, water.id: 1}, db_session)
+    db_session.commit()
+    assert db_session.get(Beverage, cola.id).stock == 1
+    assert db_session.get(Beverage, water.id).stock == 0
+
+
+def test_restore_beverages(db_session):
+    cola = Beverage(id=uuid.uuid4(), name='Cola', stock=0, price=2.5)
+    water = Beverage(id=uuid.uuid4(), name='Water', stock=1, price=1.5)
+    db_session.add_all([cola, water])
+    db_session.commit()
+
+    restore_beverages({cola.id: 3, water.id: 2}, db_session)
+    db_session.commit()
+    assert db_session.get(Beverage, cola.id).stock == 3
+    assert db_session.get(Beverage, water.id).stock == 3
+
+
+def test_try_consume_beverage(db_session):
+    beverage = Beverage(id=uuid.uuid4(), name='Lemonade', stock=2, price=3.0)
+    db_session.add(beverage)
+    db_session.commit()
+
+    assert not try_consume_beverage(beverage.id, 3, db_session)
+    assert try_consume_beverage(beverage.id, 2, db_session)
+    assert db_session.get(Beverage, beverage.id).stock == 0
+
+
+def test_try_consume_ingredients_leaves_the_commit_to_the_caller(db_session):
+    dough = Dough(id=uuid.uuid4(), name='Thin', stock=1, price=1.5)
+    pizza_type = PizzaType(id=uuid.uuid4(), name='Margherita', price=8.5, dough=dough)
+    db_session.add(pizza_type)
+    db_session.commit()
+
+    assert try_consume_ingredients(pizza_type, db_session)
+    db_session.rollback()  # The pizza could not be added, the dough is given back
+    assert db_session.get(Dough, dough.id).stock == 1
+
+    assert try_consume_ingredients(pizza_type, db_session)
+    db_session.commit()
+    assert db_session.get(Dough, dough.id).stock == 0
+    assert not try_consume_ingredients(pizza_type, db_session)
+
+
+def test_restore_ingredients_of_pizza_types(db_session):
+    dough = Dough(id=uuid.uuid4(), name='Thin', stock=0, price=1.5)
+    cheese = Topping(id=uuid.uuid4(), name='Cheese', stock=0, price=1.0)
+    pizza_type = PizzaType(id=uuid.uuid4(), name='Margherita', price=8.5, dough=dough)
+    pizza_type.toppings.append(PizzaTypeToppingQuantity(topping=cheese, quantity=2))
+    db_session.add(pizza_type)
+    db_session.commit()
+
+    restore_ingredients_of_pizza_types([pizza_type, pizza_type], db_session)  # Two pizzas of the same type
+    db_session.commit()
+    assert db_session.get(Dough, dough.id).stock == 2
+    assert db_session.get(Topping, cheese.id).stock == 4
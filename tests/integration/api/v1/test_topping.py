@@ -1,32 +1,13 @@
-import pytest
 from decimal import Decimal
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.database.models import Base
+from sqlalchemy import func, select
+from app.database.models import Topping
 import app.api.v1.endpoints.topping.crud as topping_crud
 
 from app.api.v1.endpoints.topping.schemas import ToppingCreateSchema
 
-# Create an SQLite in-memory database for testing
-TEST_DATABASE_URL = 'sqlite:///:memory:'
-engine = create_engine(TEST_DATABASE_URL, connect_args={'check_same_thread': False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-# Set up the database schema
-Base.metadata.create_all(bind=engine)
-
-
-@pytest.fixture(scope='module')
-def db_session():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 
 def test_topping_crud_operations(db_session):
-    numbers_of_toppings_before = len(topping_crud.get_all_toppings(db_session))
+    numbers_of_toppings_before = db_session.scalar(select(func.count()).select_from(Topping))
     new_topping_name = 'Pepperoni'
     new_topping_price = Decimal('2.50')
     new_topping_description = 'Spicy'
@@ -43,6 +24,7 @@ def test_topping_crud_operations(db_session):
     # Act: Add topping to database
     db_topping = topping_crud.create_topping(topping, db_session)
     created_topping_id = db_topping.id
+    assert topping_crud.create_topping(topping, db_session) is None
 
     # Assert: One more topping in database
     toppings = topping_crud.get_all_toppings(db_session)
@@ -58,28 +40,33 @@ def test_topping_crud_operations(db_session):
     assert read_topping.description == new_topping_description
     assert read_topping.stock == new_topping_stock
 
-    # Act: Update Topping
+    # Act: Update the topping in place, like PUT does while the name is unchanged
     update_topping = ToppingCreateSchema(
-        name='Double Pepperoni',
+        name=new_topping_name,
         price=Decimal('3.00'),
         description='Extra spicy and delicious pepperoni',
         stock=80,
     )
-    updated_topping = topping_crud.update_topping(read_topping, update_topping, db_session)
+    assert topping_crud.update_topping_with_same_name(created_topping_id, update_topping, db_session)
+    db_session.refresh(read_topping)
 
     # Assert: Correct topping was stored in database
-    assert updated_topping.name == 'Double Pepperoni'
-    assert updated_topping.price == Decimal('3.00')
-    assert updated_topping.description == 'Extra spicy and delicious pepperoni'
-    assert updated_topping.stock == 80
+    assert read_topping.name == new_topping_name
+    assert read_topping.price == Decimal('3.00')
+    assert read_topping.description == 'Extra spicy and delicious pepperoni'
+    assert read_topping.stock == 80
+
+    # Act & Assert: A rename is not updated in place
+    assert not topping_crud.update_topping_with_same_name(
+        created_topping_id, update_topping.copy(update={'name': 'Double Pepperoni'}), db_session)
 
     # Act: Delete topping
-    topping_crud.delete_topping_by_id(updated_topping.id, db_session)
+    assert topping_crud.delete_topping_by_id(created_topping_id, db_session)
+    assert not topping_crud.delete_topping_by_id(created_topping_id, db_session)
 
     # Assert: Correct number of toppings in database after deletion
-    toppings = topping_crud.get_all_toppings(db_session)
-    assert len(toppings) == numbers_of_toppings_before
+    assert db_session.scalar(select(func.count()).select_from(Topping)) == numbers_of_toppings_before
 
     # Assert: Correct topping was deleted from database
-    deleted_topping = topping_crud.get_topping_by_id(updated_topping.id, db_session)
+    deleted_topping = topping_crud.get_topping_by_id(created_topping_id, db_session)
     assert deleted_topping is None
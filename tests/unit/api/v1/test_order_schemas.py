@@ -5,7 +5,7 @@ from datetime import datetime
 
 import pytest
 from app.api.v1.endpoints.order.schemas import OrderSchema, OrderBaseSchema, OrderCreateSchema, \
-    OrderUpdateOrderStatusSchema
+    OrderListSchema, OrderUpdateOrderStatusSchema
 from app.api.v1.endpoints.order.schemas import PizzaBaseSchema, PizzaCreateSchema,\
     PizzaSchema, PizzaWithoutPizzaTypeSchema, JoinedPizzaPizzaTypeSchema,\
     OrderBeverageQuantityBaseSchema, OrderBeverageQuantityCreateSchema
@@ -79,6 +79,14 @@ def test_order_schema(order_dict):
     assert schema.order_status == order_dict['order_status']
 
 
+def test_order_list_schema(order_dict):
+    schema = OrderListSchema(**order_dict)
+    assert schema.id == order_dict['id']
+    assert schema.user_id == order_dict['user_id']
+    assert schema.order_status == order_dict['order_status']
+    assert not hasattr(schema, 'address')
+
+
 def test_update_schema(order_dict):
     schema = OrderUpdateOrderStatusSchema(**order_dict)
     assert schema.order_status == order_dict['order_status']
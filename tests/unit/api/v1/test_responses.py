@@ -0,0 +1,63 @@
+import datetime
+import decimal
+import json
+import uuid
+from types import SimpleNamespace
+
+from fastapi import APIRouter, FastAPI
+from fastapi.encoders import jsonable_encoder
+from starlette.requests import Request
+
+from app.api.v1.endpoints.beverage.schemas import BeverageListItemSchema
+from app.api.v1.endpoints.order.schemas import JoinedPizzaPizzaTypeSchema, OrderSchema
+from app.api.v1.responses import DecimalORJSONResponse, orm_list_response, orm_response, url_for
+
+
+def test_orm_list_response_matches_validated_beverages():
+    beverage = SimpleNamespace(id=uuid.uuid4(), name='Cola', price=decimal.Decimal('2.99'),
+                               description='Viel Zucker', stock=109)
+
+    response = orm_list_response(BeverageListItemSchema, [beverage])
+
+    assert json.loads(response.body) == jsonable_encoder([BeverageListItemSchema.from_orm(beverage)])
+
+
+def test_orm_list_response_matches_validated_orders():
+    address = SimpleNamespace(id=uuid.uuid4(), street='Hauptstrasse', post_code='64295', house_number=1,
+                              country='Germany', town='Darmstadt', first_name='Ada', last_name='Lovelace')
+    order = SimpleNamespace(id=uuid.uuid4(), user_id=uuid.uuid4(), order_status='TRANSMITTED', address=address,
+                            order_datetime=datetime.datetime(2023, 4, 15, 20, 17, tzinfo=datetime.timezone.utc))
+
+    response = orm_list_response(OrderSchema, [order])
+
+    assert json.loads(response.body) == jsonable_encoder([OrderSchema.from_orm(order)])
+
+
+def test_orm_response_matches_validated_pizza():
+    pizza = SimpleNamespace(id=uuid.uuid4(), name='Salamipizza', price=decimal.Decimal('6.99'),
+                            description='Mit extra viel Salami', default_sauce_id=None)
+
+    response = orm_response(JoinedPizzaPizzaTypeSchema, pizza)
+
+    assert json.loads(response.body) == jsonable_encoder(JoinedPizzaPizzaTypeSchema.from_orm(pizza))
+
+
+def test_decimal_orjson_response_matches_jsonable_encoder():
+    content = {'id': uuid.uuid4(), 'price': decimal.Decimal('2.99'), 'stock': 109}
+
+    response = DecimalORJSONResponse(content)
+
+    assert json.loads(response.body) == jsonable_encoder(content)
+
+
+def test_url_for_matches_request_url_for():
+    router = APIRouter()
+    router.add_api_route('/toppings/{topping_id}', lambda topping_id: None, name='get_topping')
+    app = FastAPI()
+    app.include_router(router, prefix='/v1')
+    request = Request({'type': 'http', 'app': app, 'router': app.router, 'scheme': 'http',
+                       'server': ('localhost', 8000), 'path': '/', 'root_path': '', 'query_string': b'', 'headers': []})
+    topping_id = uuid.uuid4()
+
+    assert url_for(request, 'get_topping', topping_id=topping_id) == \
+        request.url_for('get_topping', topping_id=topping_id)
@@ -5,41 +5,39 @@ import pytest
 
 from app.api.v1.endpoints.user.schemas import UserSchema, UserBaseSchema, UserCreateSchema
 
+USERNAME_CHARACTERS = string.ascii_letters + string.digits
+PASSWORD_CHARACTERS = USERNAME_CHARACTERS + '!@#$%^&*()'
+# Seeded generator of its own for all test data, so a failing run can be reproduced
+TEST_RANDOM = random.Random(0)
+
 
 def generate_random_username(length=8):
     """Generate a random username with letters and digits."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    return ''.join(TEST_RANDOM.choices(USERNAME_CHARACTERS, k=length))
 
 
 def generate_random_password(length=12):
     """Generate a random password with letters, digits, and special characters."""
-    characters = string.ascii_letters + string.digits + '!@#$%^&*()'
-    return ''.join(random.choices(characters, k=length))
+    return ''.join(TEST_RANDOM.choices(PASSWORD_CHARACTERS, k=length))
 
 
-@pytest.fixture(scope='module')
+# Only read by the tests, so it is built once per run
+@pytest.fixture(scope='session')
 def user_dict():
     return {
-        'id': uuid.uuid4(),
+        'id': uuid.UUID(int=TEST_RANDOM.getrandbits(128)),
         'username': generate_random_username(),
         'password': generate_random_password(),
     }
 
 
-def test_user_create_schema(user_dict):
-    schema = UserCreateSchema(**user_dict)
-    assert schema.username == user_dict['username']
-
-    assert not hasattr(schema, 'id')
-
-
-def test_user_base_schema(user_dict):
-    schema = UserBaseSchema(**user_dict)
+@pytest.mark.parametrize('schema_class, has_id', [
+    (UserCreateSchema, False),
+    (UserBaseSchema, False),
+    (UserSchema, True),
+])
+def test_user_schemas(user_dict, schema_class, has_id):
+    schema = schema_class(**user_dict)
     assert schema.username == user_dict['username']
 
-    assert not hasattr(schema, 'id')
-
-
-def test_schema(user_dict):
-    schema = UserSchema(**user_dict)
-    assert schema.username == user_dict['username']
+    assert hasattr(schema, 'id') == has_id